@@ -2,7 +2,8 @@
 # -----------------------------------------------------------
 # CrewAI example that:
 #   1) connects to your FEC MCP (fec_info_mcp.py) and a Search MCP via stdio,
-#   2) asks the agent to fetch the latest 5 e-file filings and write 1 paragraph per committee,
+#   2) asks the agent to fetch the latest 5 e-file filings, then writes 1 paragraph per committee
+#      (one crew run per committee, executed concurrently),
 #   3) sets `generated_at` to the most recent filing timestamp (receipt_date/filed_date/load_timestamp).
 #
 # Env you must set before running:
@@ -24,30 +25,27 @@ import pydantic.fields as _pf
 
 _OrigField = _pf.Field
 
+# Keys commonly (and incorrectly) passed directly to Field(...).
+# Built once: Field(...) runs for every model field imported by CrewAI/MCP/this module.
+_JSONISH: frozenset = frozenset({
+    "items", "anyOf", "allOf", "oneOf", "enum", "properties",
+    "format", "examples", "pattern",
+    "minItems", "maxItems", "minimum", "maximum",
+    "exclusiveMinimum", "exclusiveMaximum", "const", "nullable",
+    # people sometimes also pass "type" etc.
+    "type"
+})
+
 def _FieldPatched(*args, **kwargs):
-    # Keys commonly (and incorrectly) passed directly to Field(...)
-    jsonish = {
-        "items", "anyOf", "allOf", "oneOf", "enum", "properties",
-        "format", "examples", "pattern",
-        "minItems", "maxItems", "minimum", "maximum",
-        "exclusiveMinimum", "exclusiveMaximum", "const", "nullable",
-        # people sometimes also pass "type" etc.
-        "type"
-    }
-
-    # Merge moved keys into json_schema_extra
-    jse = kwargs.get("json_schema_extra")
-    if jse is None:
-        jse = {}
-    elif not isinstance(jse, dict):
-        jse = {"_orig": jse}
-
-    moved = False
-    for k in list(kwargs.keys()):
-        if k in jsonish:
-            jse[k] = kwargs.pop(k)
-            moved = True
+    moved = {k: kwargs.pop(k) for k in _JSONISH & kwargs.keys()}
     if moved:
+        # Merge moved keys into json_schema_extra
+        jse = kwargs.get("json_schema_extra")
+        if jse is None:
+            jse = {}
+        elif not isinstance(jse, dict):
+            jse = {"_orig": jse}
+        jse.update(moved)
         kwargs["json_schema_extra"] = jse
 
     return _OrigField(*args, **kwargs)
@@ -67,26 +65,49 @@ except RuntimeError:
 #-----------------------------------------------------------
 
 
+# Start the heavy imports (CrewAI pulls in LangChain, LiteLLM, ...) in a background thread so they
+# overlap with the cheap startup work below (cache load, model definitions, env/path checks).
+# The real `from ... import` statements further down then just read sys.modules.
+# To see the worst offenders: python -X importtime crew_latest_fec_filings_summaries.py
+import threading
+
+def _warm_imports():
+    import yaml  # noqa: F401
+    import crewai  # noqa: F401
+    import crewai_tools  # noqa: F401
+    import mcp  # noqa: F401
+    import agentics.core.llm_connections  # noqa: F401
+
+_warm_thread = threading.Thread(target=_warm_imports, name="warm-imports", daemon=True)
+_warm_thread.start()
+#-----------------------------------------------------------
+
+
 # --- std imports ---
+import json
 import os
+import re
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Tuple
 
-# --- crew & mcp imports ---
-import yaml
 from pydantic import BaseModel, Field
-from crewai import Agent, Crew, Task
-from crewai_tools import MCPServerAdapter
-from mcp import StdioServerParameters
 
-# For one-off programmatic MCP tool call (to compute newest filing timestamp)
-from mcp.client.session import ClientSession
-from mcp.client.stdio import StdioServerParameters as StdioParamsForClient
-from mcp.types import CallToolRequest
+# Optional faster JSON decoding for tool payloads
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-from agentics.core.llm_connections import get_llm_provider
+# Environment for the stdio MCP servers, built once and shared by every StdioServerParameters
+_MCP_ENV: Dict[str, str] = {"UV_PYTHON": "3.12", **os.environ}
+
+# On-disk cache for repeated MCP tool calls (search_cache.py lives next to this script)
+from search_cache import SearchCache, cache_tool_results
+
+_search_cache = SearchCache()
 
 
 # -----------------------------
@@ -100,78 +121,44 @@ def _require_env_path(var: str) -> str:
             f"Missing environment variable {var}. "
             f'Set it to the MCP server script path, e.g.\n  $env:{var} = "D:\\path\\to\\server.py"'
         )
-    if not Path(p).exists():
-        raise RuntimeError(f"{var} points to a non-existent path: {p}")
+    if not Path(p).is_file():
+        raise RuntimeError(f"{var} does not point to an existing file: {p}")
     return p
 
 
+# Canonical OpenFEC shapes: "YYYY-MM-DD" and "YYYY-MM-DDTHH:MM:SS" (optionally Z / +00:00)
+_ISO_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}):(\d{2}))?(?:Z|\+00:00)?$")
+
+
 def _parse_iso_to_utc(s: Optional[str]) -> Optional[datetime]:
     if not s:
         return None
+    m = _ISO_RE.match(s)
+    if m:
+        # fast path: build the UTC datetime straight from the captured fields
+        try:
+            return datetime(*map(int, m.groups(default="0")), tzinfo=timezone.utc)
+        except ValueError:
+            return None
     try:
         # date-only "YYYY-MM-DD"
         if len(s) == 10 and s[4] == "-" and s[7] == "-":
             return datetime.strptime(s, "%Y-%m-%d").replace(tzinfo=timezone.utc)
         # ISO datetime (normalize Z to +00:00)
         dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+        # naive timestamps are UTC, as in the fast path (astimezone would read them as local time)
+        if dt.tzinfo is None:
+            return dt.replace(tzinfo=timezone.utc)
         return dt.astimezone(timezone.utc)
     except Exception:
         return None
 
 
-async def _get_newest_filing_ts(fec_server_path: str) -> Optional[str]:
-    """
-    Programmatically call the FEC MCP tool `latest_filings` to fetch 10 rows,
-    then compute the newest timestamp across receipt_date/filed_date/load_timestamp.
-    Returns an ISO UTC string (..Z) or None.
-    """
-    params = StdioParamsForClient(
-        command=PY_CMD,
-        args=[fec_server_path],
-        env={"UV_PYTHON": "3.12", **os.environ},
-    )
-    async with ClientSession(params) as session:
-        # Ensure the tool exists
-        tools = (await session.list_tools()).tools
-        names = {t.name for t in tools}
-        if "latest_filings" not in names:
-            return None
-
-        req = CallToolRequest(
-            name="latest_filings",
-            arguments={
-                "committee": None,
-                "form_type": None,
-                "since": None,
-                "until": None,
-                "per_page": 5,
-                "pages": 1,
-                "with_totals": False,
-                "show_urls": True,
-            },
-        )
-        res = await session.call_tool(req)
-
-        # FastMCP returns outputs list; grab first json payload
-        payload: Optional[Dict[str, Any]] = None
-        for out in res.outputs:
-            if getattr(out, "type", "") == "json" and getattr(out, "json", None) is not None:
-                payload = out.json
-                break
-        if not payload:
-            return None
-
-        filings = payload.get("filings") or []
-        candidates: List[datetime] = []
-        for f in filings:
-            for key in ("receipt_date", "filed_date", "load_timestamp"):
-                dt = _parse_iso_to_utc(f.get(key))
-                if dt:
-                    candidates.append(dt)
-        if not candidates:
-            return None
-        newest = max(candidates)
-        return newest.isoformat(timespec="seconds").replace("+00:00", "Z")
+def _iso_z(dt: datetime) -> str:
+    """Format an aware datetime as UTC 'YYYY-MM-DDTHH:MM:SSZ' in one fixed-width strftime."""
+    if dt.tzinfo is not timezone.utc:
+        dt = dt.astimezone(timezone.utc)
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 # -----------------------------
@@ -195,6 +182,22 @@ class CommitteeSummary(BaseModel):
     refernces: List[Reference] = Field(default_factory=list, description="Citations used for the paragraph")
 
 
+class FilingCommittee(BaseModel):
+    committee_id: Optional[str] = None
+    committee_name: Optional[str] = None
+
+
+class LatestFilingsCommittees(BaseModel):
+    source_latest_timestamp: Optional[str] = Field(
+        default=None,
+        description="Most recent filing timestamp (receipt_date/filed_date/load_timestamp) from latest_filings."
+    )
+    committees: List[FilingCommittee] = Field(
+        default_factory=list,
+        description="Unique committees found in latest filings (first occurrence order)"
+    )
+
+
 # 1) Add this field to LatestFilingsSummaries
 class LatestFilingsSummaries(BaseModel):
     title: str = Field(
@@ -207,7 +210,7 @@ class LatestFilingsSummaries(BaseModel):
         description="Most recent filing timestamp (receipt_date/filed_date/load_timestamp) from latest_filings."
     )
     generated_at: str = Field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
+        default_factory=lambda: _iso_z(datetime.now(timezone.utc)),
         description="UTC timestamp of when this report was generated (will be overwritten from source_latest_timestamp if present)"
     )
     items: List[CommitteeSummary] = Field(
@@ -223,6 +226,17 @@ python_path = _require_env_path("MCP_PYTHON_PATH")
 fec_server_path = _require_env_path("MCP_FEC_SERVER_PATH")
 search_server_path = _require_env_path("MCP_SEARCH_SERVER_PATH")
 
+# -----------------------------
+# crew & mcp imports (already loaded by the warm-up thread)
+# -----------------------------
+_warm_thread.join()
+import yaml
+from crewai import Agent, Crew, Task
+from crewai_tools import MCPServerAdapter
+from mcp import StdioServerParameters
+
+from agentics.core.llm_connections import get_llm_provider
+
 # -----------------------------
 # MCP servers (stdio)
 # -----------------------------
@@ -231,16 +245,16 @@ search_server_path = _require_env_path("MCP_SEARCH_SERVER_PATH")
 #   Set MCP_FEC_SERVER_PATH to the path of fec_info_mcp.py
 fec_params = StdioServerParameters(
     command=python_path,  # use "python" on Windows if needed
-    args=[os.getenv("MCP_FEC_SERVER_PATH")],
-    env={"UV_PYTHON": "3.12", **os.environ},
+    args=[fec_server_path],
+    env=_MCP_ENV,
 )
 
 #   Set MCP_PYTHON_PATH to the path of the python executable from the environment
 #   Set MCP_SEARCH_SERVER_PATH to the path of fec_info_mcp.py
 search_params = StdioServerParameters(
     command=python_path,
-    args=[os.getenv("MCP_SEARCH_SERVER_PATH")],
-    env={"UV_PYTHON": "3.12", **os.environ},
+    args=[search_server_path],
+    env=_MCP_ENV,
 )
 
 
@@ -255,6 +269,8 @@ with (
 ):
     print(f"Available FEC tools:    {[t.name for t in fec_tools]}")
     print(f"Available Search tools: {[t.name for t in search_tools]}")
+    # Recurring committees produce identical search queries across runs; answer those from disk
+    search_tools = [cache_tool_results(t, _search_cache) for t in search_tools]
     tools = fec_tools + search_tools  # + fetch_tools
 
     doc_agent = Agent(
@@ -273,66 +289,112 @@ with (
         reasoning_steps=10,
         memory=False,
         verbose=True,
+        # Implicit prompt caching needs a Gemini 2.5 model, e.g. GEMINI_MODEL_ID=gemini/gemini-2.5-flash
         llm=get_llm_provider("gemini")
         # If you have a helper like get_llm_provider("openai"), pass llm=... here
     )
 
-    doc_task = Task(
+    # Step 1 runs once: fetch the latest filings and the unique committees.
+    fetch_task = Task(
         description="""\
-    Step 1) Call the FEC MCP tool `latest_filings` with:
+    Call the FEC MCP tool `latest_filings` with:
     {"committee": null, "form_type": null, "since": null, "until": null, "per_page": 5, "pages": 1,
-    "with_totals": false, "show_urls": true}
-    From the returned rows, compute the most recent timestamp across fields (in order of preference):
-    receipt_date, filed_date, load_timestamp.
-    Set this as `source_latest_timestamp` (ISO8601 UTC, e.g. 2025-09-21T13:40:55Z).
-    Then deduplicate the filings by `committee_id` (preserve first occurrence order).
-
-    Step 2) For each unique committee, call the Search MCP tool (named "search") with:
-    {"query": "<committee_name> <committee_id>", "limit": 5}
+    "with_totals": false, "show_urls": false, "unique_by_committee": true,
+    "fields": ["committee_id", "committee_name"]}
+    The returned rows are already one per committee (first occurrence order).
+    Set `source_latest_timestamp` to the `latest_timestamp` value returned by the tool (copy it as is).
+
+    Output a LatestFilingsCommittees object with:
+    - source_latest_timestamp
+    - committees[]: (committee_id, committee_name) for each returned row.
+    """,
+        expected_output=(
+            "A LatestFilingsCommittees pydantic object with source_latest_timestamp and committees[]."
+        ),
+        agent=doc_agent,
+        tools=fec_tools,
+        output_pydantic=LatestFilingsCommittees,
+    )
+
+    # Steps 2-3 run once per committee; the crew is fanned out with kickoff_for_each_async
+    # so the (network-bound) search + summarize roundtrips overlap instead of running in sequence.
+    # The description is static-first: everything up to the committee line is identical across
+    # committees, so Gemini's implicit prompt caching (Gemini 2.5+) can reuse the shared prefix
+    # (agent role/backstory, tool schemas, instructions). Only the tail changes per committee.
+    summary_task = Task(
+        description="""\
+    Step 1) Use the search results listed at the end of this task for the committee given there.
+    Only if no results are listed, call the Search MCP tool (named "web_search") with:
+    {"query": "<committee_name> <committee_id>", "max_results": 5}
     Prefer reputable sources (official sites, FEC pages, major outlets). Capture titles/URLs.
 
-    Step 3) For each committee, write ONE short paragraph (3–6 sentences), neutral tone, factual only,
+    Step 2) Write ONE short paragraph (3–6 sentences), neutral tone, factual only,
     based strictly on the search results. Include simple [#] markers in-text and map them to the sources you used.
-    If sources are too sparse, say so for that committee.
+    If sources are too sparse, say so.
 
-    Output a LatestFilingsSummaries object with:
-    - source_latest_timestamp: (from Step 1)
-    - items[]: CommitteeSummary entries (committee_id, committee_name, paragraph, citations).
+    Output a CommitteeSummary object (committee_id, committee_name, paragraph, citations).
+
+    Committee: {committee_name} {committee_id}
+    Search results:
+    {sources}
     """,
-        expected_output=(
-            "A LatestFilingsSummaries pydantic object with source_latest_timestamp and items[]."
-        ),
+        expected_output="A CommitteeSummary pydantic object.",
         agent=doc_agent,
-        output_pydantic=LatestFilingsSummaries,
+        tools=search_tools,
+        output_pydantic=CommitteeSummary,
     )
 
-
-    crew = Crew(
+    fetch_crew = Crew(
         agents=[doc_agent],
-        tasks=[doc_task],
+        tasks=[fetch_task],
         verbose=True,
     )
+    summary_crew = Crew(
+        agents=[doc_agent],
+        tasks=[summary_task],
+        verbose=True,
+    )
+
+    # --- Run the crews ---
+    fetched = fetch_crew.kickoff()
+    latest: LatestFilingsCommittees = getattr(fetched, "pydantic", None) or LatestFilingsCommittees()
+
+    # Run every committee search in ONE batch_web_search call (executed in parallel server-side)
+    # instead of one agent tool-call roundtrip per committee.
+    queries = [f"{c.committee_name or ''} {c.committee_id or ''}".strip() for c in latest.committees]
+    sources: Dict[str, List[str]] = {}
+    batch_search = next((t for t in search_tools if t.name == "batch_web_search"), None)
+    if batch_search and queries:
+        try:
+            batch = _json_loads(batch_search.run(queries=queries, max_results=5))
+            sources = {r["query"]: r.get("results") or [] for r in batch.get("results", [])}
+        except (TypeError, ValueError, KeyError, AttributeError):  # orjson.JSONDecodeError is a ValueError
+            # unexpected payload: let each summary task search on its own
+            sources = {}
+
+    inputs = [
+        {
+            "committee_id": c.committee_id or "",
+            "committee_name": c.committee_name or "",
+            "sources": "\n\n".join(sources.get(q) or []) or "(none)",
+        }
+        for c, q in zip(latest.committees, queries)
+    ]
+    outputs = (
+        asyncio.get_event_loop().run_until_complete(summary_crew.kickoff_for_each_async(inputs=inputs))
+        if inputs
+        else []
+    )
+
+    result = LatestFilingsSummaries(
+        source_latest_timestamp=latest.source_latest_timestamp,
+        items=[o.pydantic for o in outputs if getattr(o, "pydantic", None)],
+    )
 
-    # --- Run the crew ---
-    result = crew.kickoff()
-
-    if getattr(result, "pydantic", None):
-        # Overwrite generated_at from source_latest_timestamp if the agent provided it
-        st = result.pydantic.source_latest_timestamp
-        if st:
-            # Normalize *Z to +00:00 and format back to Z
-            try:
-                ts = datetime.fromisoformat(st.replace("Z", "+00:00")).astimezone(timezone.utc)
-                result.pydantic.generated_at = ts.isoformat(timespec="seconds").replace("+00:00", "Z")
-            except Exception:
-                # fall back to now if the agent gave an unexpected format
-                result.pydantic.generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
-        else:
-            # fall back to now
-            result.pydantic.generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
-
-        # Print pretty YAML with Unicode
-        print(yaml.dump(result.pydantic.model_dump(), sort_keys=False, allow_unicode=True, width=1000))
-    else:
-        print(result)
+    # Overwrite generated_at from source_latest_timestamp (the tool's latest_timestamp) if present;
+    # fall back to now if it is missing or in an unexpected format
+    ts = _parse_iso_to_utc(result.source_latest_timestamp)
+    result.generated_at = _iso_z(ts or datetime.now(timezone.utc))
 
+    # Print pretty YAML with Unicode
+    print(yaml.dump(result.model_dump(), sort_keys=False, allow_unicode=True, width=1000))
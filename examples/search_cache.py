@@ -0,0 +1,129 @@
+# search_cache.py
+# -----------------------------------------------------------
+# Small on-disk cache for MCP tool results (used by crew_latest_fec_filings_summaries.py).
+#
+# Entries are stored as {sha256(args): {"args": ..., "result": ..., "ts": ...}} in a JSON
+# file and expire after `ttl_seconds`. The cache is an LRU capped at `max_entries`: expired
+# entries are pruned on load and on every write, and the least recently used are evicted
+# past the cap, so the file (rewritten on each set) stays small. Writes go to a temp file
+# and are swapped in with os.replace, so an interrupted run never leaves a truncated cache
+# behind.
+# -----------------------------------------------------------
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "search_cache.json"
+DEFAULT_TTL_SECONDS = 86400
+DEFAULT_MAX_ENTRIES = 1000
+
+
+class SearchCache:
+    def __init__(self, path: Optional[str] = None, ttl_seconds: int = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.path = Path(path or os.getenv("SEARCH_CACHE_PATH") or DEFAULT_CACHE_PATH)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        # Least recently used first (the file keeps this order across runs)
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                loaded = json.load(fh)
+            if isinstance(loaded, dict):
+                self._entries.update(loaded)
+        except (OSError, ValueError):
+            pass
+        self._prune()
+
+    @staticmethod
+    def key(args: Dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(args, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get(self, args: Dict[str, Any], ttl_seconds: Optional[int] = None) -> Optional[Any]:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        key = self.key(args)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry.get("ts", 0) > ttl:
+                return None
+            self._entries.move_to_end(key)
+        return entry.get("result")
+
+    def set(self, args: Dict[str, Any], result: Any) -> None:
+        key = self.key(args)
+        with self._lock:
+            self._entries[key] = {"args": args, "result": result, "ts": time.time()}
+            self._entries.move_to_end(key)
+            self._prune()
+            self._flush()
+
+    def _prune(self) -> None:
+        """Drop entries older than ttl_seconds, then the least recently used past max_entries."""
+        cutoff = time.time() - self.ttl_seconds
+        for key in [k for k, e in self._entries.items() if not isinstance(e, dict) or e.get("ts", 0) < cutoff]:
+            del self._entries[key]
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _flush(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".search_cache.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(self._entries, fh, ensure_ascii=False, default=str)
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+def _has_error(result: Any) -> bool:
+    """
+    True if a tool result reports a failure: a top-level "error", or one on any item of a
+    batch payload ({"results": [{"error": ...}, ...]}). JSON strings are decoded first.
+    """
+    if isinstance(result, (str, bytes)):
+        try:
+            result = json.loads(result)
+        except ValueError:
+            return False
+    if not isinstance(result, dict):
+        return False
+    if result.get("error"):
+        return True
+    items = result.get("results")
+    return isinstance(items, list) and any(isinstance(i, dict) and i.get("error") for i in items)
+
+
+def cache_tool_results(tool: Any, cache: SearchCache) -> Any:
+    """
+    Wrap a CrewAI tool (e.g. one returned by MCPServerAdapter) so identical calls are
+    answered from `cache`. The key is the tool name plus the call arguments. Results that
+    report an error (e.g. a transient search rate-limit) are returned but not cached.
+    """
+    run = tool._run
+
+    def _cached_run(*args: Any, **kwargs: Any) -> Any:
+        cache_args = {"tool": tool.name, "args": list(args), "kwargs": kwargs}
+        hit = cache.get(cache_args)
+        if hit is not None:
+            return hit
+        result = run(*args, **kwargs)
+        if not _has_error(result):
+            cache.set(cache_args, result)
+        return result
+
+    # BaseTool is a pydantic model; bypass its __setattr__ to shadow the bound method
+    object.__setattr__(tool, "_run", _cached_run)
+    return tool
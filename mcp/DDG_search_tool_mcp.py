@@ -1,6 +1,8 @@
 """A simple search MCP server exposes Duck Duck GO search apis as tools
 """
 
+import asyncio
+
 from mcp.server.fastmcp import FastMCP
 from ddgs import DDGS
 
@@ -27,6 +29,32 @@ inurl:cats	Page url includes the word "cats"
     return [f'{x["title"]}\n{x["body"]}\n{x["href"]}' for x in search_results ]
 
 
+@mcp.tool()
+async def batch_web_search(queries: list[str], max_results: int = 5,
+                           max_concurrent: int = 5, stop_on_error: bool = False) -> dict:
+    """run several web_search queries in parallel and return all of them in one response
+    queries: list of queries, same syntax as web_search
+    max_results: number of snippets to be returned per query, usually 5 - 20
+    max_concurrent: maximum number of searches in flight at once
+    stop_on_error: if true, fail the whole batch on the first failed query;
+        otherwise failed queries are reported with an "error" and empty results
+    returns {"results": [{"query": ..., "results": [...], "error": ...}, ...]} in input order
+    """
+    sem = asyncio.Semaphore(max(1, max_concurrent))
+
+    async def _one(query: str) -> list[str]:
+        async with sem:
+            return await asyncio.to_thread(web_search, query, max_results)
+
+    outcomes = await asyncio.gather(*(_one(q) for q in queries), return_exceptions=not stop_on_error)
+    return {
+        "results": [
+            {"query": q, "results": [], "error": str(o)} if isinstance(o, BaseException)
+            else {"query": q, "results": o, "error": None}
+            for q, o in zip(queries, outcomes)
+        ]
+    }
+
 
 if __name__ == "__main__":
     mcp.run(transport="stdio")
\ No newline at end of file
@@ -15,13 +15,18 @@ Clients:
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, HttpUrl
 from mcp.server.fastmcp import FastMCP
 
-from openfec_client import OpenFECClient
+from openfec_client import EfileFiling, OpenFECClient
+
+
+# Max concurrent report-totals lookups per latest_filings call
+TOTALS_CONCURRENCY = 10
 
 
 # ----------------------------
@@ -45,6 +50,11 @@ class LatestFilingsParams(BaseModel):
     with_totals: If true, enrich F3* filings (with committee_id & file_number)
                with processed report totals. Default false.
     show_urls: If true, include fec/pdf/html/csv URLs (when available). Default false.
+    unique_by_committee: If true, keep only the first (most recent) filing per
+               committee_id. Default false.
+    fields:    If set, return only these FilingRow fields per filing (e.g.
+               ["committee_id", "committee_name", "receipt_date"]). Empty values
+               are always omitted.
     """
     committee: Optional[str] = Field(default=None)
     form_type: Optional[str] = Field(default=None)
@@ -54,6 +64,8 @@ class LatestFilingsParams(BaseModel):
     pages: int = Field(default=1, ge=1)
     with_totals: bool = Field(default=False)
     show_urls: bool = Field(default=False)
+    unique_by_committee: bool = Field(default=False)
+    fields: Optional[List[str]] = Field(default=None)
 
 
 class FilingTotals(BaseModel):
@@ -93,6 +105,8 @@ class FilingRow(BaseModel):
 class LatestFilingsResult(BaseModel):
     """Result list for latest_filings."""
     count: int
+    # Most recent receipt_date/filed_date/load_timestamp across the returned filings
+    latest_timestamp: Optional[str] = None
     filings: List[FilingRow]
 
 
@@ -102,6 +116,51 @@ class LatestFilingsResult(BaseModel):
 
 mcp = FastMCP("fec-info")
 
+# One client per process: its requests.Session keeps the TLS connection to OpenFEC alive
+# across tool calls instead of reconnecting on every invocation.
+_FEC_CLIENT: Optional[OpenFECClient] = None
+
+
+def _api_key() -> str:
+    api_key = os.getenv("FEC_API_KEY") or os.getenv("OPENFEC_API_KEY")
+    if not api_key:
+        # the demo key works but has lower rate limits
+        api_key = "DEMO_KEY"
+        #raise RuntimeError("Missing OpenFEC API key. Set FEC_API_KEY or OPENFEC_API_KEY.")
+    return api_key
+
+
+def _get_client() -> OpenFECClient:
+    global _FEC_CLIENT
+    if _FEC_CLIENT is None:
+        _FEC_CLIENT = OpenFECClient(api_key=_api_key())
+    return _FEC_CLIENT
+
+
+def _to_filing_row(r: EfileFiling, show_urls: bool) -> FilingRow:
+    # Rows were already validated by OpenFECClient (EfileFiling): skip re-validation
+    return FilingRow.model_construct(
+        committee_id=r.committee_id,
+        committee_name=r.committee_name,
+        form_type=r.form_type,
+        file_number=r.file_number,
+        fec_file_id=r.fec_file_id,
+        receipt_date=r.receipt_date,
+        filed_date=r.filed_date,
+        coverage_start_date=r.coverage_start_date,
+        coverage_end_date=r.coverage_end_date,
+        load_timestamp=r.load_timestamp,
+        amendment_number=r.amendment_number,
+        amends_file=r.amends_file,
+        beginning_image_number=r.beginning_image_number,
+        ending_image_number=r.ending_image_number,
+        # URLs (only if requested)
+        fec_url=r.fec_url if show_urls else None,
+        pdf_url=r.pdf_url if show_urls else None,
+        html_url=r.html_url if show_urls else None,
+        csv_url=r.csv_url if show_urls else None,
+    )
+
 
 @mcp.tool(name="latest_filings",
     description=(
@@ -109,59 +168,58 @@ mcp = FastMCP("fec-info")
         "processed totals enrichment. Paginate with 'per_page' and 'pages'."
     ),
 )
-def latest_filings_tool(params: LatestFilingsParams) -> LatestFilingsResult:
+async def latest_filings_tool(params: LatestFilingsParams) -> Dict[str, Any]:
     """
     Fetch latest filings from OpenFEC. Reads API key from FEC_API_KEY or OPENFEC_API_KEY.
     """
-    api_key = os.getenv("FEC_API_KEY") or os.getenv("OPENFEC_API_KEY")
-    if not api_key:
-        # the demo key works but has lower rate limits
-        api_key = "DEMO_KEY"
-        #raise RuntimeError("Missing OpenFEC API key. Set FEC_API_KEY or OPENFEC_API_KEY.")
-
-    client = OpenFECClient(api_key=api_key)
-    rows = client.latest_filings(
-        committee_id=params.committee,
-        form_type=params.form_type,
-        min_receipt_date=params.since,
-        max_receipt_date=params.until,
-        per_page=params.per_page,
-        pages=params.pages,
+    client = _get_client()
+
+    def _fetch_rows() -> List[FilingRow]:
+        return [
+            _to_filing_row(r, params.show_urls)
+            for r in client.iter_latest_filings(
+                committee_id=params.committee,
+                form_type=params.form_type,
+                min_receipt_date=params.since,
+                max_receipt_date=params.until,
+                per_page=params.per_page,
+                pages=params.pages,
+            )
+        ]
+
+    # iter_latest_filings pages with blocking requests: keep them off the server's event loop
+    out = await asyncio.to_thread(_fetch_rows)
+
+    # ISO-8601 strings from OpenFEC share a fixed prefix and sort lexicographically
+    latest_timestamp = max(
+        (v for r in out for v in (r.receipt_date, r.filed_date, r.load_timestamp) if v),
+        default=None,
     )
 
-    out: List[FilingRow] = []
-    for r in rows:
-        item = FilingRow(
-            committee_id=r.committee_id,
-            committee_name=r.committee_name,
-            form_type=r.form_type,
-            file_number=r.file_number,
-            fec_file_id=r.fec_file_id,
-            receipt_date=r.receipt_date,
-            filed_date=getattr(r, "filed_date", None),
-            coverage_start_date=r.coverage_start_date,
-            coverage_end_date=r.coverage_end_date,
-            load_timestamp=getattr(r, "load_timestamp", None),
-            amendment_number=getattr(r, "amendment_number", None),
-            amends_file=getattr(r, "amends_file", None),
-            beginning_image_number=getattr(r, "beginning_image_number", None),
-            ending_image_number=getattr(r, "ending_image_number", None),
-        )
-
-        if params.show_urls:
-            item.fec_url = r.fec_url
-            item.pdf_url = r.pdf_url
-            item.html_url = r.html_url
-            item.csv_url = r.csv_url
-
-        # Optional enrichment (F3*)
-        if (
-            params.with_totals
-            and r.committee_id
-            and r.file_number
-            and (r.form_type or "").upper().startswith("F3")
-        ):
-            rpt = client.report_totals_by_file_number(r.committee_id, r.file_number)
+    if params.unique_by_committee:
+        seen = set()
+        out = [r for r in out if r.committee_id and not (r.committee_id in seen or seen.add(r.committee_id))]
+
+    # Optional enrichment (F3*)
+    eligible = [
+        item
+        for item in out
+        if params.with_totals
+        and item.committee_id
+        and item.file_number
+        and (item.form_type or "").upper().startswith("F3")
+    ]
+
+    if eligible:
+        # Each lookup is an independent blocking HTTP request: run them concurrently
+        sem = asyncio.Semaphore(TOTALS_CONCURRENCY)
+
+        async def _totals(committee_id: str, file_number: int):
+            async with sem:
+                return await asyncio.to_thread(client.report_totals_by_file_number, committee_id, file_number)
+
+        reports = await asyncio.gather(*(_totals(item.committee_id, item.file_number) for item in eligible))
+        for item, rpt in zip(eligible, reports):
             if rpt:
                 item.totals = FilingTotals(
                     total_receipts=float(rpt.total_receipts or 0.0),
@@ -169,9 +227,14 @@ def latest_filings_tool(params: LatestFilingsParams) -> LatestFilingsResult:
                     cash_on_hand_end_period=float(rpt.cash_on_hand_end_period or 0.0),
                 )
 
-        out.append(item)
-
-    return LatestFilingsResult(count=len(out), filings=out)
+    result = LatestFilingsResult.model_construct(count=len(out), latest_timestamp=latest_timestamp, filings=out)
+    # Every field is tokens for the calling LLM: drop empty values and project to `fields` if given
+    include = (
+        {"count": True, "latest_timestamp": True, "filings": {"__all__": set(params.fields)}}
+        if params.fields
+        else None
+    )
+    return result.model_dump(mode="json", include=include, exclude_none=True)
 
 
 # ----------------------------
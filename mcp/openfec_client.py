@@ -1,345 +1,127 @@
 # openfec_client.py
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import os
 import time
 import random
+import shelve
+import threading
+from contextlib import nullcontext
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from sys import intern
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache
-from typing import Any, Dict, Generator, List, Optional, Set, Tuple
+from itertools import chain, islice
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Generator, Iterable, Iterator, List, Optional, Set, Tuple
 
 import requests
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, ValidationError, conint
+from requests.adapters import HTTPAdapter
+from pydantic import ValidationError
+
+from openfec_models import (  # re-exported: callers import the models from here
+    FECModel,
+    Pagination,
+    APIEnvelope,
+    EfileFiling,
+    ScheduleAItem,
+    ScheduleBItem,
+    _ScheduleAItemFast,
+    _ScheduleBItemFast,
+    ScheduleBByRecipientAgg,
+    CommitteeReport,
+    CommitteeCandidateLink,
+    CandidateCommittee,
+    CommitteeTotals,
+    CommitteeAbout,
+    CandidateHit,
+    DonorToCandidateAgg,
+    CommitteeSummary,
+)
+
+try:
+    import httpx  # only needed by the async (a*) methods
+except ImportError:
+    httpx = None
+
+# HTTP/2 lets the async client multiplex concurrent requests over one connection (needs h2)
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
 
 OPENFEC_BASE_URL = "https://api.open.fec.gov/v1"
 DEFAULT_TIMEOUT = 30
 DEFAULT_PER_PAGE = 100  # API max, reduces request count
+DEFAULT_MAX_WORKERS = 8  # concurrent requests for fan-out scans
+DEFAULT_CACHE_SIZE = 1024  # cached committee/candidate metadata responses (0 disables)
+RETRY_MAX_WAIT = 30  # cap (seconds) on exponential retry backoff
+DEFAULT_CACHE_TTL = 3600  # seconds a cached metadata response is served
+RECIPIENT_ID_BATCH = 50  # committee ids per multi-valued recipient_committee_id query
+DEFAULT_DISK_CACHE_TTL = 86400  # seconds a disk-cached committee lookup stays fresh
 
 
-# ---------------- Pydantic Models ----------------
-
-class FECModel(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-
-
-class Pagination(FECModel):
-    page: Optional[int] = None
-    pages: Optional[int] = None
-    per_page: Optional[int] = None
-    count: Optional[int] = None
-    count_estimate: Optional[int] = None
-    is_count_exact: Optional[bool] = None
-    count_exceed_limit: Optional[bool] = None
-
-
-class APIEnvelope(FECModel):
-    status: Optional[str] = None
-    results: List[Dict[str, Any]] = Field(default_factory=list)
-    pagination: Optional[Pagination] = None
-    api_version: Optional[str] = None
-    last_updated: Optional[str] = None
-
-
-class EfileFiling(FECModel):
-    # New/explicit fields from the JSON you provided
-    amendment_number: Optional[int] = None
-    amends_file: Optional[int] = None
-    beginning_image_number: Optional[str] = None
-    ending_image_number: Optional[str] = None
-    filed_date: Optional[str] = None                # e.g. "2025-09-21"
-    load_timestamp: Optional[str] = None            # e.g. "2025-09-21T13:41:00"
-
-    # Existing/common fields
-    committee_id: Optional[str] = None
-    committee_name: Optional[str] = None
-    form_type: Optional[str] = None
-    receipt_date: Optional[str] = None              # e.g. "2025-09-21T13:40:55"
-    coverage_start_date: Optional[str] = None
-    coverage_end_date: Optional[str] = None
-    file_number: Optional[int] = None
-    fec_file_id: Optional[str] = None
-
-    # Amendment helpers (kept for compatibility; may or may not be present)
-    is_amended: Optional[bool] = None
-    amendment_chain: Optional[List[int]] = None
-
-    # URLs
-    fec_url: Optional[HttpUrl] = None
-    pdf_url: Optional[HttpUrl] = None
-    html_url: Optional[HttpUrl] = None
-    csv_url: Optional[HttpUrl] = None
-
-
-
-class ScheduleAItem(FECModel):
-    # Itemized receipts (can be negative for refunds/chargebacks)
-    committee_id: Optional[str] = None
-    committee_name: Optional[str] = None
-    recipient_committee_type: Optional[str] = None
-    contributor_name: Optional[str] = None
-    contributor_first_name: Optional[str] = None
-    contributor_last_name: Optional[str] = None
-    contributor_middle_name: Optional[str] = None
-    contributor_occupation: Optional[str] = None
-    contributor_employer: Optional[str] = None
-    contributor_city: Optional[str] = None
-    contributor_state: Optional[str] = None
-    contributor_zip: Optional[str] = None
-    contribution_receipt_date: Optional[str] = None
-    contribution_receipt_amount: Optional[float] = None
-    two_year_transaction_period: Optional[int] = Field(default=None, ge=1976)
-    memoed_subtotal: Optional[bool] = None
-    is_individual: Optional[bool] = None
-    image_number: Optional[str] = None
-    file_number: Optional[int] = None
-
-
-class ScheduleBItem(FECModel):
-    # Itemized disbursements (can be negative for refunds/voids)
-    sub_id: Optional[int] = None
-    image_number: Optional[str] = None
-    file_number: Optional[int] = None
-    committee_id: Optional[str] = None               # spender (donor committee)
-    committee_name: Optional[str] = None
-    recipient_committee_id: Optional[str] = None     # recipient (committee)
-    recipient_name: Optional[str] = None
-    recipient_committee_type: Optional[str] = None   # <-- add this
-    disbursement_date: Optional[str] = None
-    disbursement_amount: Optional[float] = None
-    disbursement_purpose: Optional[str] = None
-    memoed_subtotal: Optional[bool] = None
-    two_year_transaction_period: Optional[int] = Field(default=None, ge=1976)
-
-
-
-class ScheduleBByRecipientAgg(FECModel):
-    recipient_committee_id: Optional[str] = None
-    recipient_name: Optional[str] = None
-    total: Optional[float] = None
-    count: Optional[int] = None
-    cycle: Optional[int] = None
-    committee_id: Optional[str] = None
-    committee_name: Optional[str] = None
-
-
-class CommitteeReport(FECModel):
-    committee_id: Optional[str] = None
-    committee_name: Optional[str] = None
-    form_type: Optional[str] = None
-    report_type: Optional[str] = None
-    report_type_full: Optional[str] = None
-    coverage_start_date: Optional[str] = None
-    coverage_end_date: Optional[str] = None
-    receipt_date: Optional[str] = None
-    file_number: Optional[int] = None
-    total_receipts: Optional[float] = None
-    total_disbursements: Optional[float] = None
-    cash_on_hand_end_period: Optional[float] = None
-    debts_owed_by_committee: Optional[float] = None
-
-
-class CommitteeCandidateLink(FECModel):
-    candidate_id: Optional[str] = None
-    name: Optional[str] = None
-    office: Optional[str] = None
-    party: Optional[str] = None
-
-
-class CandidateCommittee(FECModel):
-    committee_id: Optional[str] = None
-    name: Optional[str] = None
-    designation: Optional[str] = None  # 'P','A','L','J', etc.
-    committee_type: Optional[str] = None
-
-
-# -- Replace your CommitteeTotals with this --
-class CommitteeTotals(FECModel):
-    # Identity / metadata
-    cycle: Optional[int] = None
-    committee_id: Optional[str] = None
-    committee_name: Optional[str] = None
-    treasurer_name: Optional[str] = None
-    committee_type: Optional[str] = None
-    committee_type_full: Optional[str] = None
-    committee_designation: Optional[str] = None
-    committee_designation_full: Optional[str] = None
-    committee_state: Optional[str] = None
-    filing_frequency: Optional[str] = None
-    filing_frequency_full: Optional[str] = None
-    organization_type: Optional[str] = None
-    organization_type_full: Optional[str] = None
-    party_full: Optional[str] = None
-
-    # Coverage / timing
-    coverage_start_date: Optional[str] = None
-    coverage_end_date: Optional[str] = None
-    transaction_coverage_date: Optional[str] = None
-    first_f1_date: Optional[str] = None
-    first_file_date: Optional[str] = None
-    last_report_type_full: Optional[str] = None
-    last_report_year: Optional[int] = None
-    last_beginning_image_number: Optional[str] = None
-
-    # Cash / debts (point-in-time)
-    cash_on_hand_beginning_period: Optional[float] = None
-    last_cash_on_hand_end_period: Optional[float] = None
-    cash_on_hand_end_period: Optional[float] = None
-    last_debts_owed_by_committee: Optional[float] = None
-    last_debts_owed_to_committee: Optional[float] = None
-    debts_owed_by_committee: Optional[float] = None
-
-    # Aggregate totals (cycle / FEC aggregation)
-    receipts: Optional[float] = None
-    fed_receipts: Optional[float] = None
-    total_exp_subject_limits: Optional[float] = None
-    exp_subject_limits: Optional[float] = None
-    exp_prior_years_subject_limits: Optional[float] = None
-    disbursements: Optional[float] = None
-    fed_disbursements: Optional[float] = None
-    net_contributions: Optional[float] = None
-    net_operating_expenditures: Optional[float] = None
-
-    # Contributions (receipts side)
-    contributions: Optional[float] = None
-    individual_contributions: Optional[float] = None
-    individual_itemized_contributions: Optional[float] = None
-    individual_unitemized_contributions: Optional[float] = None
-    political_party_committee_contributions: Optional[float] = None
-    other_political_committee_contributions: Optional[float] = None
-    contribution_refunds: Optional[float] = None
-    refunded_individual_contributions: Optional[float] = None
-    refunded_other_political_committee_contributions: Optional[float] = None
-    refunded_political_party_committee_contributions: Optional[float] = None
-
-    # Receipts — other categories
-    federal_funds: Optional[float] = None
-    other_fed_receipts: Optional[float] = None
-    other_receipts: Optional[float] = None  # sometimes present on other committee types
-    offsets_to_operating_expenditures: Optional[float] = None
-
-    # Transfers (incoming/outgoing)
-    total_transfers: Optional[float] = None
-    transfers_from_affiliated_party: Optional[float] = None
-    transfers_from_nonfed_account: Optional[float] = None
-    transfers_from_nonfed_levin: Optional[float] = None
-    transfers_to_affiliated_committee: Optional[float] = None
-
-    # Loans (received/made/repayments)
-    all_loans_received: Optional[float] = None
-    loan_repayments_made: Optional[float] = None
-    loan_repayments_received: Optional[float] = None
-    loans_made: Optional[float] = None
-    loans_and_loan_repayments_made: Optional[float] = None
-    loans_and_loan_repayments_received: Optional[float] = None
-
-    # Disbursements (operating/other)
-    operating_expenditures: Optional[float] = None
-    fed_operating_expenditures: Optional[float] = None
-    other_disbursements: Optional[float] = None
-    other_fed_operating_expenditures: Optional[float] = None
-    fundraising_disbursements: Optional[float] = None
-
-    # Independent/coordinated/party activity
-    independent_expenditures: Optional[float] = None
-    coordinated_expenditures_by_party_committee: Optional[float] = None
-    fed_election_activity: Optional[float] = None
-    non_allocated_fed_election_activity: Optional[float] = None
-    shared_fed_activity: Optional[float] = None
-    shared_fed_activity_nonfed: Optional[float] = None
-    shared_fed_operating_expenditures: Optional[float] = None
-    shared_nonfed_operating_expenditures: Optional[float] = None
-    fed_candidate_committee_contributions: Optional[float] = None
-    fed_candidate_contribution_refunds: Optional[float] = None
-
-    # Convention (rare; keep for compatibility)
-    convention_exp: Optional[float] = None
-    itemized_convention_exp: Optional[float] = None
-    unitemized_convention_exp: Optional[float] = None
-    refunds_relating_convention_exp: Optional[float] = None
-    itemized_refunds_relating_convention_exp: Optional[float] = None
-    unitemized_refunds_relating_convention_exp: Optional[float] = None
-
-    # Other income / refunds (granular)
-    itemized_other_income: Optional[float] = None
-    unitemized_other_income: Optional[float] = None
-    other_refunds: Optional[float] = None
-    itemized_other_refunds: Optional[float] = None
-    unitemized_other_refunds: Optional[float] = None
-
-    # Other disbursements (granular)
-    itemized_other_disb: Optional[float] = None
-    unitemized_other_disb: Optional[float] = None
-
-    # Derived/percent fields (if present)
-    individual_contributions_percent: Optional[float] = None
-    party_and_other_committee_contributions_percent: Optional[float] = None
-    contributions_ie_and_party_expenditures_made_percent: Optional[float] = None
-    operating_expenditures_percent: Optional[float] = None
-
-    # Sponsors (rare)
-    sponsor_candidate_ids: Optional[str] = None
-    sponsor_candidate_list: Optional[List[str]] = None
-
-
-
-
-
-# -- Replace your CommitteeAbout with this --
-class CommitteeAbout(FECModel):
-    # Core identity
-    committee_id: str
-    name: Optional[str] = None
-
-    # Leadership
-    treasurer_name: Optional[str] = None
-
-    # Type / designation (short + full)
-    committee_type: Optional[str] = None
-    committee_type_full: Optional[str] = None
-    designation: Optional[str] = None
-    designation_full: Optional[str] = None
-
-    # Filing (fixes your error)
-    filing_frequency: Optional[str] = None
-
-    # Party
-    party: Optional[str] = None
-    party_full: Optional[str] = None
-
-    # Location
-    state: Optional[str] = None
-    state_full: Optional[str] = None
-    city: Optional[str] = None
-    zip: Optional[str] = None
-    street_1: Optional[str] = None
-    street_2: Optional[str] = None
-
-    # Misc
-    website: Optional[str] = None
-
-
-
-
-class CandidateHit(FECModel):
-    candidate_id: str
-    name: str
-    office: Optional[str] = None
-    party: Optional[str] = None
-    state: Optional[str] = None
-    district: Optional[str] = None
-    election_years: Optional[List[int]] = None
+# ---------------- Helpers ----------------
 
+@lru_cache(maxsize=128)
+def _normalize_cycle_cached(cycle: int) -> int:
+    if cycle < 1976:
+        raise ValueError("cycle must be >= 1976")
+    return cycle if (cycle % 2 == 0) else (cycle - 1)
 
-class DonorToCandidateAgg(FECModel):
-    donor_committee_id: str
-    donor_committee_name: Optional[str] = None
-    total: float
-    count: int
 
+def _normalize_cycle(cycle: Optional[int]) -> Optional[int]:
+    """Round an election year down to its two-year cycle (cached; None passes through)."""
+    if cycle is None:
+        return None
+    return _normalize_cycle_cached(cycle)
 
-class CommitteeSummary(FECModel):
-    about: Optional[CommitteeAbout] = None
-    totals: Optional[CommitteeTotals] = None
-    latest_report: Optional[CommitteeReport] = None
+
+def _freeze_params(params: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Hashable, order-independent form of a params dict (cache keys). List values - repeated
+    query params such as several recipient_committee_id - become tuples.
+    """
+    return tuple(sorted(
+        (k, tuple(v) if isinstance(v, (list, tuple)) else v) for k, v in params.items()
+    ))
+
+
+def _fit_page(per_page: int, limit: Optional[int]) -> int:
+    """Don't request (and parse) a bigger page than the caller will read."""
+    return min(per_page, limit) if limit and limit > 0 else per_page
+
+
+def _iso_date(value: Optional[str], name: str) -> Optional[str]:
+    """
+    Normalize a date filter to YYYY-MM-DD (a trailing "T..."/" ..." time part is dropped), so
+    it compares correctly with row dates as a string. Raises ValueError for anything else.
+    """
+    if not value:
+        return None
+    rest = value[10:]
+    try:
+        if rest and rest[0] not in "T ":
+            raise ValueError(value)
+        return date.fromisoformat(value[:10]).isoformat()
+    except ValueError:
+        raise ValueError(f"{name} must be an ISO date (YYYY-MM-DD), got {value!r}") from None
+
+
+def _pages_for(limit: Optional[int], per_page: int) -> Optional[int]:
+    """Pages needed to cover `limit` rows (None = unbounded), so prefetch doesn't overshoot."""
+    if not limit or per_page <= 0:
+        return None
+    return -(-limit // per_page)
 
 
 # ---------------- Client ----------------
@@ -353,96 +135,359 @@ class OpenFECClient:
         user_agent: str = "openfec-pydantic-client/1.0.0",
         retry_attempts: int = 5,
         retry_backoff: float = 1.5,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        trusted_rows: bool = False,
+        fast_items: bool = False,
+        disk_cache_path: Optional[str] = None,
+        disk_cache_ttl: int = DEFAULT_DISK_CACHE_TTL,
+        page_size: int = DEFAULT_PER_PAGE,
+        http2: bool = False,
+        max_in_flight: Optional[int] = None,
     ) -> None:
         self.api_key = api_key or os.getenv("FEC_API_KEY") or os.getenv("OPENFEC_API_KEY")
         if not self.api_key:
             raise ValueError("Missing OpenFEC API key. Set FEC_API_KEY or pass api_key=...")
 
         self.base_url = base_url.rstrip("/")
+        self._url_prefix = self.base_url + "/"
         self.timeout = timeout
         self.retry_attempts = retry_attempts
         self.retry_backoff = retry_backoff
-
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.max_workers = max(1, max_workers)
+        # Rate limiting: a shared "don't send before" deadline set by 429s, and an optional cap on
+        # concurrent requests across all fan-out pools (e.g. 2 for a low OpenFEC key tier). The
+        # async methods get an asyncio.Semaphore of the same size per event loop (_async_client).
+        self._throttle_until = 0.0
+        self._throttle_lock = threading.Lock()
+        self._max_in_flight = max_in_flight
+        self._in_flight = threading.BoundedSemaphore(max_in_flight) if max_in_flight else nullcontext()
+        # Rows per page when a call doesn't pass per_page; the API caps it at 100
+        self._page_size = max(1, min(page_size, DEFAULT_PER_PAGE))
+        # Opt-in: build result rows with model_construct (no per-field validation/coercion)
+        self.trusted_rows = trusted_rows
+        # Opt-in: Schedule A/B items as plain __slots__ objects instead of pydantic models
+        self._schedule_a_item = _ScheduleAItemFast if fast_items else ScheduleAItem
+        self._schedule_b_item = _ScheduleBItemFast if fast_items else ScheduleBItem
+
+        # LRU of GET responses keyed by (path, sorted params). Only slow-changing metadata requests
+        # opt in (_request(cacheable=True): committee, totals, reports, candidate links); e-filings
+        # and Schedule A/B pages are always fetched fresh, and empty results are never stored.
+        # Entries are (envelope, monotonic time stored) and expire after cache_ttl seconds.
+        self._cache: "OrderedDict[tuple, Tuple[APIEnvelope, float]]" = OrderedDict()
+        self._cache_max = max(0, cache_size)
+        self._cache_ttl = cache_ttl
+        self._cache_lock = threading.Lock()
+
+        # Opt-in persistent cache (shelve) for slow-changing committee lookups, so repeated runs
+        # over the same committees skip those requests, e.g. disk_cache_path="~/.cache/openfec/cache".
+        # The shelf holds a dbm file open: close() the client (or use it as a context manager) so
+        # another process can open the same path.
+        self._disk: Optional[shelve.Shelf] = None
+        self._disk_ttl = disk_cache_ttl
+        self._disk_lock = threading.Lock()
+        if disk_cache_path:
+            path = Path(disk_cache_path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._disk = shelve.open(str(path))
+
+        # httpx.AsyncClient for the a* methods, created lazily (and per event loop) on first use
+        self._ahttp: Optional["httpx.AsyncClient"] = None
+        self._ahttp_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ain_flight: Any = nullcontext()
+
+        # Headers for the httpx clients; HTTP/2 forbids connection-specific headers like Connection
+        self._headers = {
             "Accept": "application/json",
             "User-Agent": user_agent,
             "X-Api-Key": self.api_key,
-        })
+        }
+        self.session = requests.Session()
+        self.session.headers.update({**self._headers, "Connection": "keep-alive"})
+        # All requests go to one host, so one host pool (pool_connections) is enough; size it for
+        # the widest fan-out (stream pool x page window, each up to max_workers) so no kept-alive
+        # socket is discarded and re-handshaked under load. Retries are handled in _fetch.
+        pool_size = max(32, max_in_flight or self.max_workers * self.max_workers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=False, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Opt-in: send sync requests over one multiplexed HTTP/2 connection (httpx + h2) instead of
+        # a pool of HTTP/1.1 sockets; the concurrent page windows then share a single TLS session
+        self._h2: Optional["httpx.Client"] = None
+        self._transport_errors: Tuple[type, ...] = (requests.RequestException,)
+        if http2:
+            if httpx is None or not _HTTP2:
+                raise RuntimeError("http2=True needs httpx with HTTP/2 support (pip install 'httpx[http2]')")
+            self._h2 = httpx.Client(
+                http2=True,
+                headers=self._headers,
+                limits=httpx.Limits(max_connections=20),
+                timeout=httpx.Timeout(self.timeout, pool=None),
+            )
+            self._transport_errors = (requests.RequestException, httpx.HTTPError)
 
     # ---------- helpers ----------
 
-    @staticmethod
-    def _normalize_cycle(cycle: Optional[int]) -> Optional[int]:
-        if cycle is None:
+    def close(self) -> None:
+        """Release the HTTP session/clients and the disk cache. Idempotent."""
+        self.session.close()
+        if self._h2 is not None:
+            self._h2.close()
+            self._h2 = None
+        self._drop_async_client()
+        if self._disk is not None:
+            with self._disk_lock:
+                self._disk.close()
+                self._disk = None
+
+    def __enter__(self) -> "OpenFECClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def cache_clear(self) -> None:
+        """
+        Drop all cached responses: in-memory, on disk (if enabled) and the memoized
+        committee -> candidate links (that memo is shared by all clients in the process).
+        """
+        with self._cache_lock:
+            self._cache.clear()
+        OpenFECClient._committee_candidate_links.cache_clear()
+        if self._disk is not None:
+            with self._disk_lock:
+                self._disk.clear()
+                self._disk.sync()
+
+    def _disk_get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        if self._disk is None:
             return None
-        if cycle < 1976:
-            raise ValueError("cycle must be >= 1976")
-        return cycle if (cycle % 2 == 0) else (cycle - 1)
+        with self._disk_lock:
+            hit = self._disk.get(key)
+        if hit is not None and time.time() - hit[0] < self._disk_ttl:
+            return hit[1]
+        return None
+
+    def _disk_put(self, key: str, rows: List[Dict[str, Any]]) -> None:
+        if self._disk is None:
+            return
+        with self._disk_lock:
+            self._disk[key] = (time.time(), rows)
+            self._disk.sync()
+
+    def _disk_cached_rows(self, key: str, path: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Result rows for a request, served from the disk cache while younger than disk_cache_ttl."""
+        rows = self._disk_get(key)
+        if rows is None:
+            rows = self._request(path, params, cacheable=True).results or []
+            # Like the in-memory cache, never pin an empty answer (e.g. not processed yet)
+            if rows:
+                self._disk_put(key, rows)
+        return rows
 
-    def _request(self, path: str, params: Optional[Dict[str, Any]] = None) -> APIEnvelope:
-        url = f"{self.base_url}/{path.lstrip('/')}"
-        params = params or {}
-        params.setdefault("per_page", DEFAULT_PER_PAGE)
+    def _prepare(self, path: str, params: Optional[Dict[str, Any]],
+                 cacheable: bool = False) -> Tuple[str, Dict[str, Any], Optional[tuple]]:
+        """URL, effective params and cache key (None when not cacheable or caching is off) for one GET."""
+        url = self._url_prefix + path.lstrip("/")
+        # Never mutate the caller's dict (_paginate reuses one dict across pages)
+        if not params:
+            params = {"per_page": self._page_size}
+        elif "per_page" not in params:
+            params = {**params, "per_page": self._page_size}
+        key = (path, _freeze_params(params)) if cacheable and self._cache_max else None
+        return url, params, key
+
+    def _cache_get(self, key: Optional[tuple]) -> Optional[APIEnvelope]:
+        if key is None:
+            return None
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is None:
+                return None
+            if time.monotonic() - hit[1] > self._cache_ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return hit[0]
+
+    def _cache_put(self, key: Optional[tuple], envelope: APIEnvelope) -> None:
+        # Empty results are often "not processed yet": keep asking rather than pinning the miss
+        if key is None or not envelope.results:
+            return
+        with self._cache_lock:
+            self._cache[key] = (envelope, time.monotonic())
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter: retry_backoff * 2^(attempt-1), capped, plus up to retry_backoff."""
+        return min(RETRY_MAX_WAIT, self.retry_backoff * 2 ** (attempt - 1)) + random.uniform(0, self.retry_backoff)
 
+    def _throttle_delay(self, retry_after: Optional[str], attempt: int) -> float:
+        """
+        Seconds to wait after a 429: the server's Retry-After (delta-seconds or HTTP-date) if
+        usable, else exponential backoff. The pause is shared: every request on this client waits
+        it out, so a concurrent fan-out backs off as a whole instead of hammering the limit.
+        """
+        delay: Optional[float] = None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+        if delay is None:
+            delay = self._backoff(attempt)
+        delay = max(0.0, delay)
+        with self._throttle_lock:
+            self._throttle_until = max(self._throttle_until, time.monotonic() + delay)
+        return delay
+
+    def _throttle_wait(self) -> float:
+        """Seconds left in a server-requested pause (0 when not throttled)."""
+        return max(0.0, self._throttle_until - time.monotonic())
+
+    def _request(self, path: str, params: Optional[Dict[str, Any]] = None, *, cacheable: bool = False) -> APIEnvelope:
+        url, params, key = self._prepare(path, params, cacheable)
+        hit = self._cache_get(key)
+        if hit is not None:
+            return hit
+        envelope = self._fetch(url, params)
+        self._cache_put(key, envelope)
+        return envelope
+
+    def _fetch(self, url: str, params: Dict[str, Any]) -> APIEnvelope:
         last_err: Optional[Exception] = None
         for attempt in range(1, self.retry_attempts + 1):
             try:
-                resp = self.session.get(url, params=params, timeout=self.timeout)
-                if resp.status_code == 429:
-                    ra = resp.headers.get("Retry-After")
-                    if ra:
-                        try:
-                            sleep_s = float(ra)
-                        except ValueError:
-                            sleep_s = self.retry_backoff * attempt
+                wait = self._throttle_wait()
+                if wait:
+                    time.sleep(wait)
+                with self._in_flight:
+                    if self._h2 is not None:
+                        resp = self._h2.get(url, params=params)
                     else:
-                        sleep_s = self.retry_backoff * attempt + random.uniform(0, 0.5 * attempt)
-                    time.sleep(sleep_s)
+                        resp = self.session.get(url, params=params, timeout=self.timeout)
+                if resp.status_code == 429 and attempt < self.retry_attempts:
+                    time.sleep(self._throttle_delay(resp.headers.get("Retry-After"), attempt))
                     continue
+                # a 429 on the last attempt raises here like any other HTTP error
                 resp.raise_for_status()
-                data = resp.json()
-                return APIEnvelope.model_validate(data)
-            except (requests.RequestException, ValidationError) as e:
+                data = _loads(resp.content)
+                return APIEnvelope.from_response(data)
+            # ValueError covers undecodable bodies (json/orjson decode errors)
+            except (*self._transport_errors, ValidationError, ValueError) as e:
                 last_err = e
                 if attempt >= self.retry_attempts:
                     raise
-                time.sleep(self.retry_backoff * attempt + random.uniform(0, 0.2))
+                time.sleep(self._backoff(attempt))
         assert last_err is not None
         raise last_err  # type: ignore
 
-    def _paginate(self, path: str, params: Dict[str, Any]) -> Generator[Dict[str, Any], None, None]:
+    def _paginate(self, path: str, params: Dict[str, Any], *, max_pages: Optional[int] = None,
+                  window: Optional[int] = None, ramp: bool = False,
+                  first: "Optional[Future[APIEnvelope]]" = None) -> Generator[Dict[str, Any], None, None]:
+        """
+        Yield result rows page by page. Once the first envelope reports pagination.pages, the
+        remaining pages are fetched concurrently (up to `window` in flight, default max_workers)
+        and still yielded in page order. Follow-up requests are always in flight before the current
+        page's rows are handed out. max_pages bounds how many pages are requested (None = all).
+        ramp=True prefetches nothing while the first page is consumed, then one page, doubling the
+        window as pages are consumed: for consumers that stop early on a row limit that the page
+        count can't express. `first` is an already-submitted request for the first page (same
+        params), used instead of requesting it again.
+
+        The page count is the only terminator while pagination is present; the "short page means
+        last page" probe runs solely in the degraded case where the envelope has no page count.
+        """
         page = int(params.get("page", 1) or 1)
-        per_page = int(params.get("per_page", DEFAULT_PER_PAGE) or DEFAULT_PER_PAGE)
-        while True:
-            envelope = self._request(path, {**params, "page": page, "per_page": per_page})
-            results = envelope.results or []
-            for row in results:
-                yield row
-            p = envelope.pagination
-            if p and p.page is not None and p.pages is not None:
-                if p.page >= p.pages:
+        per_page = int(params.get("per_page") or self._page_size)
+        last_allowed = page + max_pages - 1 if max_pages else None
+        local = dict(params)
+        local["per_page"] = per_page
+        local["page"] = page
+        envelope = first.result() if first is not None else self._request(path, local)
+        results = envelope.results or []
+        if last_allowed is not None and page >= last_allowed:
+            yield from results
+            return
+        p = envelope.pagination_raw
+        cur, pages = (p.get("page"), p.get("pages")) if p else (None, None)
+        if cur is not None and pages is not None:
+            if cur >= pages:
+                yield from results
+                return
+            last = pages if last_allowed is None else min(pages, last_allowed)
+            yield from self._paginate_concurrent(path, local, cur + 1, last, head=results, window=window, ramp=ramp)
+            return
+        yield from self._paginate_sequential(path, local, page, per_page, last_allowed, results)
+
+    def _paginate_concurrent(self, path: str, params: Dict[str, Any], first: int, last: int,
+                             head: Iterable[Dict[str, Any]] = (), window: Optional[int] = None,
+                             ramp: bool = False) -> Generator[Dict[str, Any], None, None]:
+        # Sliding window of in-flight page requests; each page gets its own params dict since
+        # requests run on worker threads. A private pool avoids deadlocking callers that are
+        # themselves running on a fan-out pool. `head` (rows already fetched) is yielded only
+        # after the window is submitted, so the network works while the caller consumes it.
+        window = min(max(1, window or self.max_workers), last - first + 1)
+        size = 0 if ramp else window
+        pool = ThreadPoolExecutor(max_workers=window)
+        pending: "deque[Future[APIEnvelope]]" = deque()
+        next_page = first
+        try:
+            while next_page <= last and len(pending) < size:
+                pending.append(pool.submit(self._request, path, {**params, "page": next_page}))
+                next_page += 1
+            yield from head
+            while True:
+                size = min(window, max(1, size * 2))
+                while next_page <= last and len(pending) < size:
+                    pending.append(pool.submit(self._request, path, {**params, "page": next_page}))
+                    next_page += 1
+                if not pending:
                     break
-                page = p.page + 1
-                continue
-            if len(results) < per_page or per_page <= 0:
-                break
-            page += 1
+                envelope = pending.popleft().result()
+                results = envelope.results or []
+                if not results:
+                    break
+                yield from results
+        finally:
+            # Consumers often stop early (limit reached): drop pages that haven't started
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _paginate_sequential(self, path: str, params: Dict[str, Any], page: int, per_page: int,
+                             last_allowed: Optional[int], results: List[Dict[str, Any]]) -> Generator[Dict[str, Any], None, None]:
+        # No page count to plan around: a full page means there may be another, so request it
+        # before handing out the current rows, and stop at the first short page
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            while True:
+                pending: Optional[Future[APIEnvelope]] = None
+                if len(results) >= per_page > 0 and (last_allowed is None or page < last_allowed):
+                    page += 1
+                    pending = pool.submit(self._request, path, {**params, "page": page})
+                yield from results
+                if pending is None:
+                    return
+                results = pending.result().results or []
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     # ---------- committee info (About + Totals + Summary) ----------
 
     def committee_about(self, committee_id: str) -> Optional[CommitteeAbout]:
-        env = self._request(f"committee/{committee_id}/", {"per_page": 1})
-        rows = env.results or []
-        return CommitteeAbout.model_validate(rows[0]) if rows else None
+        rows = self._disk_cached_rows(f"about:{committee_id}", f"committee/{committee_id}/", {"per_page": 1})
+        return CommitteeAbout.from_row(rows[0], trusted=self.trusted_rows) if rows else None
 
     def committee_totals(self, committee_id: str, *, cycle: Optional[int] = None) -> Optional[CommitteeTotals]:
-        params: Dict[str, Any] = {"per_page": 1}
-        if cycle:
-            params["cycle"] = self._normalize_cycle(cycle)
-        env = self._request(f"committee/{committee_id}/totals/", params)
-        rows = env.results or []
-        return CommitteeTotals.model_validate(rows[0]) if rows else None
+        params = self._totals_params(cycle)
+        rows = self._disk_cached_rows(f"totals:{committee_id}:{params.get('cycle')}", f"committee/{committee_id}/totals/", params)
+        return CommitteeTotals.from_row(rows[0], trusted=self.trusted_rows) if rows else None
 
     def committee_summary(self, committee_id: str, *, cycle: Optional[int] = None) -> CommitteeSummary:
         return CommitteeSummary(
@@ -462,69 +507,82 @@ class OpenFECClient:
         Returns None if the report isn't processed yet or not found.
         """
         params = {"per_page": 1, "file_number": file_number}
-        env = self._request(f"committee/{committee_id}/reports/", params)
+        env = self._request(f"committee/{committee_id}/reports/", params, cacheable=True)
         rows = env.results or []
         if not rows:
             return None
-        return CommitteeReport.model_validate(rows[0])
+        return CommitteeReport.from_row(rows[0], trusted=self.trusted_rows)
 
-    def latest_committee_report(self, committee_id: str, *, cycle: Optional[int] = None, form_type: Optional[str] = None) -> Optional[CommitteeReport]:
+    @staticmethod
+    def _totals_params(cycle: Optional[int]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"per_page": 1}
+        if cycle:
+            params["cycle"] = _normalize_cycle(cycle)
+        return params
+
+    @staticmethod
+    def _latest_report_params(cycle: Optional[int], form_type: Optional[str]) -> Dict[str, Any]:
         params: Dict[str, Any] = {"sort": "-coverage_end_date", "per_page": 1}
         if cycle:
-            params["two_year_transaction_period"] = self._normalize_cycle(cycle)
+            params["two_year_transaction_period"] = _normalize_cycle(cycle)
         if form_type:
             params["form_type"] = form_type
-        env = self._request(f"committee/{committee_id}/reports/", params)
+        return params
+
+    def latest_committee_report(self, committee_id: str, *, cycle: Optional[int] = None, form_type: Optional[str] = None) -> Optional[CommitteeReport]:
+        params = self._latest_report_params(cycle, form_type)
+        env = self._request(f"committee/{committee_id}/reports/", params, cacheable=True)
         rows = env.results or []
         if not rows:
             return None
-        return CommitteeReport.model_validate(rows[0])
+        return CommitteeReport.from_row(rows[0], trusted=self.trusted_rows)
 
-    def latest_filings(self, *, committee_id: Optional[str] = None, form_type: Optional[str] = None,
-                       min_receipt_date: Optional[str] = None, max_receipt_date: Optional[str] = None,
-                       per_page: int = 50, pages: int = 1) -> List[EfileFiling]:
+    def iter_latest_filings(self, *, committee_id: Optional[str] = None, form_type: Optional[str] = None,
+                            min_receipt_date: Optional[str] = None, max_receipt_date: Optional[str] = None,
+                            per_page: int = 50, pages: int = 1) -> Generator[EfileFiling, None, None]:
+        """Like latest_filings, but yields one filing at a time as pages arrive."""
         params: Dict[str, Any] = {"sort": "-receipt_date", "per_page": per_page}
         if committee_id: params["committee_id"] = committee_id
         if form_type: params["form_type"] = form_type
         if min_receipt_date: params["min_receipt_date"] = min_receipt_date
         if max_receipt_date: params["max_receipt_date"] = max_receipt_date
-        out: List[EfileFiling] = []
-        for row in self._paginate("efile/filings/", params):
-            out.append(EfileFiling.model_validate(row))
-            if len(out) >= per_page * max(1, pages):
-                break
-        return out
+        rows = islice(self._paginate("efile/filings/", params, max_pages=max(1, pages)), per_page * max(1, pages))
+        for row in rows:
+            yield EfileFiling.from_row(row, trusted=self.trusted_rows)
+
+    def latest_filings(self, *, committee_id: Optional[str] = None, form_type: Optional[str] = None,
+                       min_receipt_date: Optional[str] = None, max_receipt_date: Optional[str] = None,
+                       per_page: int = 50, pages: int = 1) -> List[EfileFiling]:
+        return list(self.iter_latest_filings(committee_id=committee_id, form_type=form_type,
+                                             min_receipt_date=min_receipt_date, max_receipt_date=max_receipt_date,
+                                             per_page=per_page, pages=pages))
 
     # ---------- Schedule A ----------
 
     def contributions_to_committee(self, committee_id: str, *, is_individual: Optional[bool] = None,
                                    cycle: Optional[int] = None, since: Optional[str] = None,
                                    per_page: int = 50, limit: Optional[int] = 200) -> Generator[ScheduleAItem, None, None]:
+        per_page = _fit_page(per_page, limit)
         params: Dict[str, Any] = {"committee_id": committee_id, "sort": "-contribution_receipt_date", "per_page": per_page}
         if is_individual is not None: params["is_individual"] = str(is_individual).lower()
-        if cycle: params["two_year_transaction_period"] = self._normalize_cycle(cycle)
+        if cycle: params["two_year_transaction_period"] = _normalize_cycle(cycle)
         if since: params["min_date"] = since
-        count = 0
-        for row in self._paginate("schedules/schedule_a/", params):
-            yield ScheduleAItem.model_validate(row)
-            count += 1
-            if limit and count >= limit: break
+        for row in islice(self._paginate("schedules/schedule_a/", params, max_pages=_pages_for(limit, per_page)), limit or None):
+            yield self._schedule_a_item.from_row(row, trusted=self.trusted_rows)
 
     def donor_activity(self, *, contributor_name: Optional[str] = None, contributor_employer: Optional[str] = None,
                        state: Optional[str] = None, cycle: Optional[int] = None,
                        per_page: int = 50, limit: Optional[int] = 200) -> Generator[ScheduleAItem, None, None]:
         if not (contributor_name or contributor_employer):
             raise ValueError("Provide contributor_name or contributor_employer.")
+        per_page = _fit_page(per_page, limit)
         params: Dict[str, Any] = {"sort": "-contribution_receipt_date", "per_page": per_page}
         if contributor_name: params["contributor_name"] = contributor_name
         if contributor_employer: params["contributor_employer"] = contributor_employer
         if state: params["contributor_state"] = state
-        if cycle: params["two_year_transaction_period"] = self._normalize_cycle(cycle)
-        count = 0
-        for row in self._paginate("schedules/schedule_a/", params):
-            yield ScheduleAItem.model_validate(row)
-            count += 1
-            if limit and count >= limit: break
+        if cycle: params["two_year_transaction_period"] = _normalize_cycle(cycle)
+        for row in islice(self._paginate("schedules/schedule_a/", params, max_pages=_pages_for(limit, per_page)), limit or None):
+            yield self._schedule_a_item.from_row(row, trusted=self.trusted_rows)
 
     # ---------- Schedule B ----------
 
@@ -532,45 +590,36 @@ class OpenFECClient:
                                cycle: Optional[int] = None, per_page: int = DEFAULT_PER_PAGE, limit: Optional[int] = 200) -> Generator[ScheduleBItem, None, None]:
         if not (committee_id or recipient_committee_id):
             raise ValueError("Provide committee_id (spender) or recipient_committee_id (receiver).")
+        per_page = _fit_page(per_page, limit)
         params: Dict[str, Any] = {"sort": "-disbursement_date", "per_page": per_page}
         if committee_id: params["committee_id"] = committee_id
         if recipient_committee_id: params["recipient_committee_id"] = recipient_committee_id
-        if cycle: params["two_year_transaction_period"] = self._normalize_cycle(cycle)
-        count = 0
-        for row in self._paginate("schedules/schedule_b/", params):
-            yield ScheduleBItem.model_validate(row)
-            count += 1
-            if limit and count >= limit: break
+        if cycle: params["two_year_transaction_period"] = _normalize_cycle(cycle)
+        for row in islice(self._paginate("schedules/schedule_b/", params, max_pages=_pages_for(limit, per_page)), limit or None):
+            yield self._schedule_b_item.from_row(row, trusted=self.trusted_rows)
 
     def schedule_b_by_recipient_id(self, recipient_committee_id: str, *, cycle: int,
                                    per_page: int = DEFAULT_PER_PAGE, limit: Optional[int] = 200) -> Generator[ScheduleBByRecipientAgg, None, None]:
-        params: Dict[str, Any] = {"recipient_id": recipient_committee_id, "cycle": self._normalize_cycle(cycle), "per_page": per_page}
-        count = 0
-        for row in self._paginate("schedules/schedule_b/by_recipient_id/", params):
-            yield ScheduleBByRecipientAgg.model_validate(row)
-            count += 1
-            if limit and count >= limit: break
+        per_page = _fit_page(per_page, limit)
+        params: Dict[str, Any] = {"recipient_id": recipient_committee_id, "cycle": _normalize_cycle(cycle), "per_page": per_page}
+        for row in islice(self._paginate("schedules/schedule_b/by_recipient_id/", params, max_pages=_pages_for(limit, per_page)), limit or None):
+            yield ScheduleBByRecipientAgg.from_row(row, trusted=self.trusted_rows)
 
     # ---------- Candidates & Cohorts ----------
 
     def search_candidates(self, q: str, *, cycle: Optional[int] = None,
                           per_page: int = 50, limit: Optional[int] = 200) -> List[CandidateHit]:
+        per_page = _fit_page(per_page, limit)
         params: Dict[str, Any] = {"q": q, "sort": "name", "per_page": per_page}
         if cycle:
-            params["cycle"] = self._normalize_cycle(cycle)
-        out: List[CandidateHit] = []
-        count = 0
-        for row in self._paginate("candidates/search/", params):
-            out.append(CandidateHit.model_validate(row))
-            count += 1
-            if limit and count >= limit:
-                break
-        return out
+            params["cycle"] = _normalize_cycle(cycle)
+        rows = islice(self._paginate("candidates/search/", params, max_pages=_pages_for(limit, per_page)), limit or None)
+        return [CandidateHit.from_row(row, trusted=self.trusted_rows) for row in rows]
 
     @lru_cache(maxsize=2000)
     def _committee_candidate_links(self, committee_id: str) -> List[CommitteeCandidateLink]:
-        env = self._request(f"committee/{committee_id}/candidates/", {"per_page": 50})
-        return [CommitteeCandidateLink.model_validate(r) for r in (env.results or [])]
+        rows = self._disk_cached_rows(f"ccl:{committee_id}", f"committee/{committee_id}/candidates/", {"per_page": 50})
+        return [CommitteeCandidateLink.from_row(r, trusted=self.trusted_rows) for r in rows]
 
     def candidate_committees(self, candidate_id: str, *, cycle: Optional[int] = None, cohort: str = "authorized") -> List[CandidateCommittee]:
         """
@@ -579,9 +628,12 @@ class OpenFECClient:
           - 'all_linked': all committees returned by OpenFEC for the candidate (incl leadership PAC 'L', JFC 'J', etc.)
         """
         params: Dict[str, Any] = {"per_page": 100}
-        if cycle: params["cycle"] = self._normalize_cycle(cycle)
-        env = self._request(f"candidate/{candidate_id}/committees/", params)
-        committees = [CandidateCommittee.model_validate(r) for r in (env.results or [])]
+        if cycle: params["cycle"] = _normalize_cycle(cycle)
+        env = self._request(f"candidate/{candidate_id}/committees/", params, cacheable=True)
+        return self._cohort_committees(env.results or [], cohort)
+
+    def _cohort_committees(self, rows: List[Dict[str, Any]], cohort: str) -> List[CandidateCommittee]:
+        committees = [CandidateCommittee.from_row(r, trusted=self.trusted_rows) for r in rows]
         if cohort == "authorized":
             committees = [c for c in committees if (c.designation or "").upper() in {"P", "A"}]
         return committees
@@ -590,33 +642,74 @@ class OpenFECClient:
                                        per_page: int = 100, limit: Optional[int] = None,
                                        cohort: str = "authorized") -> List[DonorToCandidateAgg]:
         recips = self.candidate_committees(candidate_id, cycle=cycle, cohort=cohort)
-        recipient_ids = [c.committee_id for c in recips if c.committee_id]
+        # dict.fromkeys: drop repeated committees (each would be a full scan) but keep first-seen order
+        recipient_ids = list(dict.fromkeys(c.committee_id for c in recips if c.committee_id))
         if not recipient_ids:
             return []
 
-        totals: Dict[str, Dict[str, Any]] = {}
-        for rcid in recipient_ids:
-            params = {"recipient_id": rcid, "cycle": self._normalize_cycle(cycle), "per_page": per_page}
-            scanned = 0
-            for row in self._paginate("schedules/schedule_b/by_recipient_id/", params):
-                donor_id = row.get("committee_id")
-                donor_name = row.get("committee_name")
-                total_amt = float(row.get("total") or 0.0)
-                cnt = int(row.get("count") or 0)
-                if not donor_id or total_amt == 0:
-                    continue
-                if donor_id not in totals:
-                    totals[donor_id] = {"donor_committee_id": donor_id, "donor_committee_name": donor_name, "total": 0.0, "count": 0}
-                totals[donor_id]["total"] += total_amt
-                totals[donor_id]["count"] += cnt
-                scanned += 1
-                if limit and scanned >= limit:
-                    break
+        norm_cycle = _normalize_cycle(cycle)
 
-        rows = [DonorToCandidateAgg(donor_committee_id=v["donor_committee_id"], donor_committee_name=v.get("donor_committee_name"),
-                                    total=round(float(v["total"]), 2), count=int(v["count"])) for v in totals.values()]
-        rows.sort(key=lambda x: x.total, reverse=True)
-        return rows
+        # Recipients are scanned concurrently and their page windows share the max_workers
+        # budget, so nested fan-out never has more than ~max_workers requests in flight
+        scans_at_once = min(self.max_workers, len(recipient_ids))
+        window = max(1, self.max_workers // scans_at_once)
+
+        def _scan(rcid: str) -> Dict[str, List[Any]]:
+            # One recipient's pagination. The fold stops at `limit` kept rows, which no page
+            # count can express, so with a limit the window ramps up from a single page.
+            params = {"recipient_id": rcid, "cycle": norm_cycle, "per_page": per_page}
+            rows = self._paginate("schedules/schedule_b/by_recipient_id/", params, window=window, ramp=bool(limit))
+            try:
+                return self._fold_donor_rows(rows, limit)
+            finally:
+                rows.close()
+
+        with ThreadPoolExecutor(max_workers=scans_at_once) as pool:
+            # map() hands results back in recipient order, so merging stays deterministic
+            return self._merge_donor_accs(pool.map(_scan, recipient_ids))
+
+    @staticmethod
+    def _fold_donor_rows(rows: Iterable[Dict[str, Any]], limit: Optional[int]) -> Dict[str, List[Any]]:
+        # Rows are folded straight into per-donor [total, count, name] slots, so a row costs
+        # no allocation unless it introduces a new donor.
+        acc: Dict[str, List[Any]] = {}
+        kept = 0
+        for row in rows:
+            donor_id = row.get("committee_id")
+            total_amt = float(row.get("total") or 0.0)
+            if not donor_id or total_amt == 0:
+                continue
+            t = acc.get(donor_id)
+            if t is None:
+                # The same donor ids recur across recipients/pages: intern them so the merge
+                # below hashes/compares one shared string instead of per-row decoded copies
+                t = acc[intern(donor_id)] = [0.0, 0, None]
+            t[0] += total_amt
+            t[1] += int(row.get("count") or 0)
+            if t[2] is None:
+                t[2] = row.get("committee_name")
+            kept += 1
+            if limit and kept >= limit:
+                break
+        return acc
+
+    @staticmethod
+    def _merge_donor_accs(accs: Iterable[Dict[str, List[Any]]]) -> List[DonorToCandidateAgg]:
+        # donor_id -> [total, count, name]
+        totals: Dict[str, List[Any]] = defaultdict(lambda: [0.0, 0, None])
+        for acc in accs:
+            for donor_id, (total_amt, cnt, donor_name) in acc.items():
+                t = totals[donor_id]
+                t[0] += total_amt
+                t[1] += cnt
+                if t[2] is None:
+                    t[2] = donor_name
+
+        # Rank the plain (id, total, count, name) tuples, then build the result models in order.
+        # The values are produced here (str/float/int), so the models skip re-validation.
+        ranked = sorted(((did, round(v[0], 2), v[1], v[2]) for did, v in totals.items()), key=itemgetter(1), reverse=True)
+        return [DonorToCandidateAgg.model_construct(donor_committee_id=did, donor_committee_name=name, total=total, count=cnt)
+                for did, total, cnt, name in ranked]
 
     def committee_payments_to_candidate_items(
         self,
@@ -624,7 +717,7 @@ class OpenFECClient:
         candidate_id: Optional[str] = None,   # <-- now optional
         *,
         cycle: int,
-        per_page: int = DEFAULT_PER_PAGE,
+        per_page: Optional[int] = None,
         limit: Optional[int] = 200,
         include_memos: bool = False,
         dedupe: bool = True,
@@ -646,62 +739,113 @@ class OpenFECClient:
 
         Guardrails/notes:
         - include_memos=False excludes memo rows (recommended to match aggregates)
-        - dedupe=True drops duplicates by sub_id (fallback composite key otherwise)
-        - since/until: YYYY-MM-DD server-side filters
+        - dedupe=True drops duplicates by sub_id, else filing + transaction_id, else a composite
+            key; the seen-set spans every stream of the call, so no duplicate is yielded twice
+        - since/until: YYYY-MM-DD server-side filters (an ISO datetime is cut to its date;
+            other formats raise ValueError)
         - scan_limit / max_pages: bound scanning
+        - per_page defaults to the client's page_size (API max 100: fewest round-trips)
         """
-        seen: Set[Tuple[Any, ...]] = set()
+        since = _iso_date(since, "since")
+        until = _iso_date(until, "until")
+        per_page = per_page or self._page_size
+        normalized_cycle = _normalize_cycle(cycle)
+        seen: Set[int] = set()
+        skip_memos = not include_memos
+        check_dates = bool(since or until)
         yielded = 0
         scanned_total = 0
 
-        def _yield_rows(params_base: Dict[str, Any]) -> Generator[ScheduleBItem, None, None]:
+        # Pages come from _paginate (a window of concurrent requests, rows in page order);
+        # cap it so the prefetch window doesn't run past scan_limit / max_pages
+        pages_cap = _pages_for(scan_limit, per_page)
+        if max_pages is not None:
+            pages_cap = max_pages if pages_cap is None else min(pages_cap, max_pages)
+
+        def _stream(params_base: Dict[str, Any],
+                    first: "Optional[Future[APIEnvelope]]" = None) -> Iterator[Dict[str, Any]]:
+            if pages_cap is not None and pages_cap <= 0:
+                return iter(())
+            # Filtered/deduped rows count toward `limit`, which no page count can express: under a
+            # limit, ramp the window up from nothing instead of prefetching a full window
+            return self._paginate("schedules/schedule_b/", params_base, max_pages=pages_cap,
+                                  ramp=bool(limit), first=first)
+
+        def _yield_rows(rows: Iterable[Dict[str, Any]]) -> Generator[ScheduleBItem, None, None]:
             nonlocal yielded, scanned_total
-            page = 1
-            while True:
-                if max_pages is not None and page > max_pages:
-                    break
-                envelope = self._request("schedules/schedule_b/", {**params_base, "page": page, "per_page": per_page})
-                rows = envelope.results or []
-                if not rows:
-                    break
-                for row in rows:
-                    scanned_total += 1
-                    if scan_limit and scanned_total > scan_limit:
-                        return
-                    item = ScheduleBItem.model_validate(row)
-                    if dedupe:
-                        if item.sub_id is not None:
-                            key = ("sub_id", item.sub_id)
-                        else:
-                            key = (
-                                "fallback",
-                                item.image_number,
-                                float(item.disbursement_amount or 0.0),
-                                item.disbursement_date,
-                                item.recipient_committee_id,
-                            )
-                        if key in seen:
-                            continue
-                        seen.add(key)
-                    yield item
-                    yielded += 1
-                    if limit and yielded >= limit:
-                        return
-                p = envelope.pagination
-                if p and p.page is not None and p.pages is not None:
-                    if p.page >= p.pages:
-                        break
-                    page = p.page + 1
-                else:
-                    if len(rows) < per_page:
-                        break
-                    page += 1
+            # Resolve per-call attributes once, not per row
+            make_item = self._schedule_b_item.from_row
+            trusted = self.trusted_rows
+            for row in rows:
+                scanned_total += 1
+                if scan_limit and scanned_total > scan_limit:
+                    return
+                # Re-check the server-side filters on the raw row before doing any work on it;
+                # ISO dates compare correctly as strings
+                if skip_memos and row.get("memoed_subtotal"):
+                    continue
+                if check_dates:
+                    d = row.get("disbursement_date")
+                    if d and ((since and d[:10] < since) or (until and d[:10] > until)):
+                        continue
+                # Dedupe on the raw row so duplicates are never validated
+                if dedupe:
+                    # Store 64-bit hashes rather than the keys themselves: the set holds plain
+                    # ints and no key tuple outlives the row (amounts compared in cents). It is
+                    # bounded by scan_limit, so an exact set beats a probabilistic filter here.
+                    sub_id = row.get("sub_id")
+                    txn = row.get("transaction_id")
+                    if sub_id is not None:
+                        key = hash(sub_id)
+                    elif txn and row.get("file_number") is not None:
+                        key = hash((row["file_number"], txn))
+                    else:
+                        key = hash((
+                            row.get("image_number"),
+                            round(float(row.get("disbursement_amount") or 0.0) * 100),
+                            row.get("disbursement_date"),
+                            row.get("recipient_committee_id"),
+                        ))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                yield make_item(row, trusted=trusted)
+                yielded += 1
+                if limit and yielded >= limit:
+                    return
+
+        def _yield_streams(param_sets: List[Dict[str, Any]]) -> Generator[ScheduleBItem, None, None]:
+            # Independent query streams (committee batches), read lazily and in order so dedupe
+            # and limits behave as a serial scan: a stream is only paged once the previous one is
+            # exhausted, through one _yield_rows over the chained streams. Without a limit, the
+            # next stream's first page is requested while the current one is being read.
+            prefetch = not limit and pages_cap != 0
+            pool = ThreadPoolExecutor(max_workers=1) if prefetch and len(param_sets) > 1 else None
+
+            def _first_page(ps: Dict[str, Any]) -> "Optional[Future[APIEnvelope]]":
+                if pool is None:
+                    return None
+                return pool.submit(self._request, "schedules/schedule_b/", {**ps, "page": 1})
+
+            def _streams() -> Iterator[Iterator[Dict[str, Any]]]:
+                upcoming = _first_page(param_sets[0])
+                for i, ps in enumerate(param_sets):
+                    current = upcoming
+                    upcoming = _first_page(param_sets[i + 1]) if i + 1 < len(param_sets) else None
+                    yield _stream(ps, current)
+
+            try:
+                yield from _yield_rows(chain.from_iterable(_streams()))
+            finally:
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
 
         # Shared base filters
         base: Dict[str, Any] = {
             "committee_id": donor_committee_id,
-            "two_year_transaction_period": self._normalize_cycle(cycle),
+            "two_year_transaction_period": normalized_cycle,
             "sort": "-disbursement_date",
+            "per_page": per_page,
         }
         if not include_memos:
             base["memoed_subtotal"] = "false"
@@ -712,24 +856,210 @@ class OpenFECClient:
 
         # If no candidate_id: fetch all payments to candidate authorized committees (H/S/P)
         if not candidate_id:
-            # The API supports filtering by recipient committee type.
-            # Query each type to keep result sizes manageable.
-            for r_type in ("H", "S", "P"):
-                params = {**base, "recipient_committee_type": r_type}
-                yield from _yield_rows(params)
+            # recipient_committee_type is multi-valued: one scan covers all three types, so this
+            # hot path feeds the single stream straight into _yield_rows (no fan-out dispatch)
+            yield from _yield_rows(_stream({**base, "recipient_committee_type": ["H", "S", "P"]}))
             return
 
         # Existing candidate-specific behavior below
 
         # If matching "authorized" aggregate exactly, use candidate recipient_id
         if match_aggregate and cohort == "authorized":
-            params = {**base, "recipient_id": candidate_id}
-            yield from _yield_rows(params)
+            yield from _yield_rows(_stream({**base, "recipient_id": candidate_id}))
             return
 
         # Otherwise iterate authorized/all linked recipient committees for the candidate
         committees = self.candidate_committees(candidate_id, cycle=cycle, cohort=cohort)
-        recipient_ids = [c.committee_id for c in committees if c.committee_id]
-        for rcid in recipient_ids:
-            params = {**base, "recipient_committee_id": rcid}
-            yield from _yield_rows(params)
+        # dict.fromkeys: drop repeated committees (each would be a full scan) but keep first-seen order
+        recipient_ids = list(dict.fromkeys(c.committee_id for c in committees if c.committee_id))
+        if recipient_ids:
+            # recipient_committee_id is multi-valued (repeated query param): one scan per batch of
+            # committees instead of one per committee, batched to keep URLs short
+            batches = [recipient_ids[i:i + RECIPIENT_ID_BATCH] for i in range(0, len(recipient_ids), RECIPIENT_ID_BATCH)]
+            yield from _yield_streams([{**base, "recipient_committee_id": batch} for batch in batches])
+
+    # ---------- async (httpx) ----------
+
+    def _async_client(self) -> "httpx.AsyncClient":
+        if httpx is None:
+            raise RuntimeError("The async OpenFEC methods need httpx (pip install httpx)")
+        loop = asyncio.get_running_loop()
+        if self._ahttp is None or self._ahttp_loop is not loop:
+            # httpx clients are tied to the loop they first ran on; callers using asyncio.run
+            # repeatedly get a fresh one per loop
+            self._drop_async_client()
+            self._ahttp = httpx.AsyncClient(
+                http2=_HTTP2,
+                headers=self._headers,
+                limits=httpx.Limits(max_connections=2 * self.max_workers, max_keepalive_connections=self.max_workers),
+                # waiting for a free connection is normal during fan-out; only the request itself times out
+                timeout=httpx.Timeout(self.timeout, pool=None),
+            )
+            self._ahttp_loop = loop
+            self._ain_flight = asyncio.Semaphore(self._max_in_flight) if self._max_in_flight else nullcontext()
+        return self._ahttp
+
+    def _drop_async_client(self) -> None:
+        # Forget the current AsyncClient, closing it on its own loop if that loop still runs
+        # (e.g. in another thread). A closed loop has already torn down the client's sockets.
+        client, loop = self._ahttp, self._ahttp_loop
+        self._ahttp = None
+        self._ahttp_loop = None
+        if client is not None and loop is not None and loop.is_running() and not loop.is_closed():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                loop.create_task(client.aclose())
+            else:
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client (the sync session is unaffected)."""
+        if self._ahttp is not None:
+            await self._ahttp.aclose()
+            self._ahttp = None
+            self._ahttp_loop = None
+
+    async def _arequest(self, path: str, params: Optional[Dict[str, Any]] = None, *, cacheable: bool = False) -> APIEnvelope:
+        url, params, key = self._prepare(path, params, cacheable)
+        hit = self._cache_get(key)
+        if hit is not None:
+            return hit
+        envelope = await self._afetch(url, params)
+        self._cache_put(key, envelope)
+        return envelope
+
+    async def _afetch(self, url: str, params: Dict[str, Any]) -> APIEnvelope:
+        client = self._async_client()
+        last_err: Optional[Exception] = None
+        for attempt in range(1, self.retry_attempts + 1):
+            try:
+                wait = self._throttle_wait()
+                if wait:
+                    await asyncio.sleep(wait)
+                async with self._ain_flight:
+                    resp = await client.get(url, params=params)
+                if resp.status_code == 429 and attempt < self.retry_attempts:
+                    await asyncio.sleep(self._throttle_delay(resp.headers.get("Retry-After"), attempt))
+                    continue
+                resp.raise_for_status()
+                data = _loads(resp.content)
+                return APIEnvelope.from_response(data)
+            except (httpx.HTTPError, ValidationError, ValueError) as e:
+                last_err = e
+                if attempt >= self.retry_attempts:
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+        assert last_err is not None
+        raise last_err  # type: ignore
+
+    async def _apaginate(self, path: str, params: Dict[str, Any], *, max_pages: Optional[int] = None,
+                         window: Optional[int] = None, ramp: bool = False) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Async _paginate: yield each page's rows in page order. Pages after the first are fetched
+        in windows of up to `window` concurrent requests (default max_workers), so a consumer that
+        stops early (limit reached) leaves the rest unrequested. ramp=True starts the window at one
+        page and doubles it each round, for callers that usually stop after the first page or two.
+        """
+        page = int(params.get("page", 1) or 1)
+        per_page = int(params.get("per_page") or self._page_size)
+        last_allowed = page + max_pages - 1 if max_pages else None
+        base = {**params, "per_page": per_page}
+        envelope = await self._arequest(path, {**base, "page": page})
+        results: List[Dict[str, Any]] = envelope.results or []
+        yield results
+        p = envelope.pagination_raw
+        cur, pages = (p.get("page"), p.get("pages")) if p else (None, None)
+        if cur is None or pages is None:
+            # No page count to fan out over: walk pages until a short one
+            while len(results) >= per_page > 0 and (last_allowed is None or page < last_allowed):
+                page += 1
+                results = (await self._arequest(path, {**base, "page": page})).results or []
+                yield results
+            return
+        last = pages if last_allowed is None else min(pages, last_allowed)
+        limit_window = max(1, window or self.max_workers)
+        size = 1 if ramp else limit_window
+        next_page = cur + 1
+        while next_page <= last:
+            batch = range(next_page, min(last, next_page + size - 1) + 1)
+            envelopes = await asyncio.gather(*(self._arequest(path, {**base, "page": n}) for n in batch))
+            for env in envelopes:
+                results = env.results or []
+                if not results:
+                    return
+                yield results
+            next_page = batch[-1] + 1
+            size = min(limit_window, size * 2)
+
+    async def _adisk_cached_rows(self, key: str, path: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        rows = self._disk_get(key)
+        if rows is None:
+            rows = (await self._arequest(path, params, cacheable=True)).results or []
+            if rows:
+                self._disk_put(key, rows)
+        return rows
+
+    async def acommittee_about(self, committee_id: str) -> Optional[CommitteeAbout]:
+        rows = await self._adisk_cached_rows(f"about:{committee_id}", f"committee/{committee_id}/", {"per_page": 1})
+        return CommitteeAbout.from_row(rows[0], trusted=self.trusted_rows) if rows else None
+
+    async def acommittee_totals(self, committee_id: str, *, cycle: Optional[int] = None) -> Optional[CommitteeTotals]:
+        params = self._totals_params(cycle)
+        rows = await self._adisk_cached_rows(f"totals:{committee_id}:{params.get('cycle')}", f"committee/{committee_id}/totals/", params)
+        return CommitteeTotals.from_row(rows[0], trusted=self.trusted_rows) if rows else None
+
+    async def alatest_committee_report(self, committee_id: str, *, cycle: Optional[int] = None, form_type: Optional[str] = None) -> Optional[CommitteeReport]:
+        env = await self._arequest(f"committee/{committee_id}/reports/", self._latest_report_params(cycle, form_type), cacheable=True)
+        rows = env.results or []
+        return CommitteeReport.from_row(rows[0], trusted=self.trusted_rows) if rows else None
+
+    async def acommittee_summary(self, committee_id: str, *, cycle: Optional[int] = None) -> CommitteeSummary:
+        about, totals, latest_report = await asyncio.gather(
+            self.acommittee_about(committee_id),
+            self.acommittee_totals(committee_id, cycle=cycle),
+            self.alatest_committee_report(committee_id, cycle=cycle),
+        )
+        return CommitteeSummary(about=about, totals=totals, latest_report=latest_report)
+
+    async def acandidate_committees(self, candidate_id: str, *, cycle: Optional[int] = None, cohort: str = "authorized") -> List[CandidateCommittee]:
+        params: Dict[str, Any] = {"per_page": 100}
+        if cycle: params["cycle"] = _normalize_cycle(cycle)
+        env = await self._arequest(f"candidate/{candidate_id}/committees/", params, cacheable=True)
+        return self._cohort_committees(env.results or [], cohort)
+
+    async def adonors_to_candidate_aggregates(self, candidate_id: str, *, cycle: int,
+                                              per_page: int = 100, limit: Optional[int] = None,
+                                              cohort: str = "authorized") -> List[DonorToCandidateAgg]:
+        recips = await self.acandidate_committees(candidate_id, cycle=cycle, cohort=cohort)
+        # dict.fromkeys: drop repeated committees (each would be a full scan) but keep first-seen order
+        recipient_ids = list(dict.fromkeys(c.committee_id for c in recips if c.committee_id))
+        if not recipient_ids:
+            return []
+        norm_cycle = _normalize_cycle(cycle)
+        # At most max_workers recipients scan at once, and their page windows share that budget
+        scans_at_once = min(self.max_workers, len(recipient_ids))
+        gate = asyncio.Semaphore(scans_at_once)
+        window = max(1, self.max_workers // scans_at_once)
+
+        async def _scan(rcid: str) -> Dict[str, List[Any]]:
+            params = {"recipient_id": rcid, "cycle": norm_cycle, "per_page": per_page}
+            rows: List[Dict[str, Any]] = []
+            kept = 0
+            async with gate:
+                pages = self._apaginate("schedules/schedule_b/by_recipient_id/", params, window=window, ramp=bool(limit))
+                try:
+                    async for page_rows in pages:
+                        rows.extend(page_rows)
+                        # Stop requesting pages once the fold has `limit` rows to keep
+                        kept += sum(1 for r in page_rows if r.get("committee_id") and float(r.get("total") or 0.0))
+                        if limit and kept >= limit:
+                            break
+                finally:
+                    await pages.aclose()
+            return self._fold_donor_rows(rows, limit)
+
+        # gather() keeps recipient order, so merging stays deterministic
+        return self._merge_donor_accs(await asyncio.gather(*(_scan(rcid) for rcid in recipient_ids)))
@@ -0,0 +1,455 @@
+# openfec_models.py
+# Pydantic models for OpenFEC API payloads, used by openfec_client.py (which re-exports them).
+#
+# Kept free of client/network code so the module can be compiled on its own, e.g.
+#   cythonize -i openfec_models.py      (or: mypyc openfec_models.py)
+# A compiled extension next to this file is picked up by `import openfec_models` ahead of
+# the .py source; without one, the pure-Python module is used unchanged.
+from __future__ import annotations
+
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, computed_field, conint, model_validator
+
+
+# ---------------- Pydantic Models ----------------
+
+class FECModel(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    # Field names of the concrete model, filled in per subclass
+    _FIELDS: ClassVar[FrozenSet[str]] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        # runs after pydantic has collected model_fields (plain __init_subclass__ runs too early)
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._FIELDS = frozenset(cls.model_fields)
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any], *, trusted: bool = False):
+        """
+        Build a model from one API result row.
+        trusted=True skips validation/coercion (model_construct) and only keeps known fields;
+        use it when the payload shape is known to match the model.
+        """
+        if not trusted:
+            return cls.model_validate(row)
+        # one pass over the row with O(1) membership tests against the precomputed field set
+        fields = cls._FIELDS
+        return cls.model_construct(**{k: v for k, v in row.items() if k in fields})
+
+
+class Pagination(FECModel):
+    page: Optional[int] = None
+    pages: Optional[int] = None
+    per_page: Optional[int] = None
+    count: Optional[int] = None
+    count_estimate: Optional[int] = None
+    is_count_exact: Optional[bool] = None
+    count_exceed_limit: Optional[bool] = None
+
+
+class APIEnvelope(FECModel):
+    status: Optional[str] = None
+    # Rows are validated by the caller's model; don't walk the list here as well
+    results: Any = Field(default_factory=list)
+    api_version: Optional[str] = None
+    last_updated: Optional[str] = None
+    # The pagination block as received; the client's paging loops read this plain dict
+    pagination_raw: Optional[Dict[str, Any]] = Field(default=None, exclude=True, repr=False)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _pagination_input(cls, data: Any) -> Any:
+        # `pagination` is a read-only computed field, so validation would drop it as extra:
+        # accept it as input (dict or Pagination) and store it, validated, as pagination_raw
+        if isinstance(data, dict) and data.get("pagination") is not None and data.get("pagination_raw") is None:
+            data = dict(data)
+            p = data.pop("pagination")
+            if not isinstance(p, Pagination):
+                p = Pagination.model_validate(p)
+            data["pagination_raw"] = p.model_dump()
+        return data
+
+    @computed_field
+    @property
+    def pagination(self) -> Optional[Pagination]:
+        # Typed view, built only when someone asks for it rather than once per page
+        p = self.pagination_raw
+        return Pagination.from_row(p, trusted=True) if p is not None else None
+
+    @classmethod
+    def from_response(cls, data: Any) -> "APIEnvelope":
+        """
+        Build an envelope from a decoded response without re-validating every row.
+        Falls back to full validation if the payload doesn't have the expected shape; a
+        `results` that still isn't a list raises ValueError (the client retries those).
+        """
+        try:
+            results = data.get("results") or []
+            pagination = data.get("pagination")
+            if not isinstance(results, list) or not (pagination is None or isinstance(pagination, dict)):
+                raise TypeError("unexpected envelope shape")
+            return cls.model_construct(
+                status=data.get("status"),
+                results=results,
+                api_version=data.get("api_version"),
+                last_updated=data.get("last_updated"),
+                pagination_raw=pagination,
+            )
+        except (AttributeError, KeyError, TypeError):
+            envelope = cls.model_validate(data)
+            # results is typed Any (rows are validated later), so check its shape here: a
+            # string would otherwise be paged through character by character
+            if envelope.results is None:
+                envelope.results = []
+            elif not isinstance(envelope.results, list):
+                raise ValueError(f"unexpected results payload: {type(envelope.results).__name__}")
+            # pagination was validated (and coerced) by _pagination_input, so the paging loops
+            # can compare ints
+            return envelope
+
+
+class EfileFiling(FECModel):
+    # New/explicit fields from the JSON you provided
+    amendment_number: Optional[int] = None
+    amends_file: Optional[int] = None
+    beginning_image_number: Optional[str] = None
+    ending_image_number: Optional[str] = None
+    filed_date: Optional[str] = None                # e.g. "2025-09-21"
+    load_timestamp: Optional[str] = None            # e.g. "2025-09-21T13:41:00"
+
+    # Existing/common fields
+    committee_id: Optional[str] = None
+    committee_name: Optional[str] = None
+    form_type: Optional[str] = None
+    receipt_date: Optional[str] = None              # e.g. "2025-09-21T13:40:55"
+    coverage_start_date: Optional[str] = None
+    coverage_end_date: Optional[str] = None
+    file_number: Optional[int] = None
+    fec_file_id: Optional[str] = None
+
+    # Amendment helpers (kept for compatibility; may or may not be present)
+    is_amended: Optional[bool] = None
+    amendment_chain: Optional[List[int]] = None
+
+    # URLs
+    fec_url: Optional[HttpUrl] = None
+    pdf_url: Optional[HttpUrl] = None
+    html_url: Optional[HttpUrl] = None
+    csv_url: Optional[HttpUrl] = None
+
+
+
+class ScheduleAItem(FECModel):
+    # Itemized receipts (can be negative for refunds/chargebacks)
+    committee_id: Optional[str] = None
+    committee_name: Optional[str] = None
+    recipient_committee_type: Optional[str] = None
+    contributor_name: Optional[str] = None
+    contributor_first_name: Optional[str] = None
+    contributor_last_name: Optional[str] = None
+    contributor_middle_name: Optional[str] = None
+    contributor_occupation: Optional[str] = None
+    contributor_employer: Optional[str] = None
+    contributor_city: Optional[str] = None
+    contributor_state: Optional[str] = None
+    contributor_zip: Optional[str] = None
+    contribution_receipt_date: Optional[str] = None
+    contribution_receipt_amount: Optional[float] = None
+    two_year_transaction_period: Optional[int] = Field(default=None, ge=1976)
+    memoed_subtotal: Optional[bool] = None
+    is_individual: Optional[bool] = None
+    image_number: Optional[str] = None
+    file_number: Optional[int] = None
+
+
+class ScheduleBItem(FECModel):
+    # Itemized disbursements (can be negative for refunds/voids)
+    sub_id: Optional[int] = None
+    transaction_id: Optional[str] = None             # filer-assigned; unique within a filing
+    image_number: Optional[str] = None
+    file_number: Optional[int] = None
+    committee_id: Optional[str] = None               # spender (donor committee)
+    committee_name: Optional[str] = None
+    recipient_committee_id: Optional[str] = None     # recipient (committee)
+    recipient_name: Optional[str] = None
+    recipient_committee_type: Optional[str] = None   # <-- add this
+    disbursement_date: Optional[str] = None
+    disbursement_amount: Optional[float] = None
+    disbursement_purpose: Optional[str] = None
+    memoed_subtotal: Optional[bool] = None
+    two_year_transaction_period: Optional[int] = Field(default=None, ge=1976)
+
+
+
+class _FastItem:
+    """
+    Plain __slots__ row holder for the Schedule A/B hot loops (OpenFECClient(fast_items=True)).
+    Mirrors the attribute/model_dump surface of the pydantic model it shadows, but does no
+    validation or coercion: values are taken from the API row as-is.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any], *, trusted: bool = True):
+        obj = object.__new__(cls)
+        get = row.get
+        for name in cls.__slots__:
+            object.__setattr__(obj, name, get(name))
+        return obj
+
+    def model_dump(self, *, exclude_none: bool = False, **_: Any) -> Dict[str, Any]:
+        out = {name: getattr(self, name) for name in self.__slots__}
+        if exclude_none:
+            return {k: v for k, v in out.items() if v is not None}
+        return out
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = " ".join(f"{n}={getattr(self, n)!r}" for n in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class _ScheduleAItemFast(_FastItem):
+    __slots__ = tuple(ScheduleAItem.model_fields)
+
+
+class _ScheduleBItemFast(_FastItem):
+    __slots__ = tuple(ScheduleBItem.model_fields)
+
+
+class ScheduleBByRecipientAgg(FECModel):
+    recipient_committee_id: Optional[str] = None
+    recipient_name: Optional[str] = None
+    total: Optional[float] = None
+    count: Optional[int] = None
+    cycle: Optional[int] = None
+    committee_id: Optional[str] = None
+    committee_name: Optional[str] = None
+
+
+class CommitteeReport(FECModel):
+    committee_id: Optional[str] = None
+    committee_name: Optional[str] = None
+    form_type: Optional[str] = None
+    report_type: Optional[str] = None
+    report_type_full: Optional[str] = None
+    coverage_start_date: Optional[str] = None
+    coverage_end_date: Optional[str] = None
+    receipt_date: Optional[str] = None
+    file_number: Optional[int] = None
+    total_receipts: Optional[float] = None
+    total_disbursements: Optional[float] = None
+    cash_on_hand_end_period: Optional[float] = None
+    debts_owed_by_committee: Optional[float] = None
+
+
+class CommitteeCandidateLink(FECModel):
+    candidate_id: Optional[str] = None
+    name: Optional[str] = None
+    office: Optional[str] = None
+    party: Optional[str] = None
+
+
+class CandidateCommittee(FECModel):
+    committee_id: Optional[str] = None
+    name: Optional[str] = None
+    designation: Optional[str] = None  # 'P','A','L','J', etc.
+    committee_type: Optional[str] = None
+
+
+# -- Replace your CommitteeTotals with this --
+class CommitteeTotals(FECModel):
+    # Identity / metadata
+    cycle: Optional[int] = None
+    committee_id: Optional[str] = None
+    committee_name: Optional[str] = None
+    treasurer_name: Optional[str] = None
+    committee_type: Optional[str] = None
+    committee_type_full: Optional[str] = None
+    committee_designation: Optional[str] = None
+    committee_designation_full: Optional[str] = None
+    committee_state: Optional[str] = None
+    filing_frequency: Optional[str] = None
+    filing_frequency_full: Optional[str] = None
+    organization_type: Optional[str] = None
+    organization_type_full: Optional[str] = None
+    party_full: Optional[str] = None
+
+    # Coverage / timing
+    coverage_start_date: Optional[str] = None
+    coverage_end_date: Optional[str] = None
+    transaction_coverage_date: Optional[str] = None
+    first_f1_date: Optional[str] = None
+    first_file_date: Optional[str] = None
+    last_report_type_full: Optional[str] = None
+    last_report_year: Optional[int] = None
+    last_beginning_image_number: Optional[str] = None
+
+    # Cash / debts (point-in-time)
+    cash_on_hand_beginning_period: Optional[float] = None
+    last_cash_on_hand_end_period: Optional[float] = None
+    cash_on_hand_end_period: Optional[float] = None
+    last_debts_owed_by_committee: Optional[float] = None
+    last_debts_owed_to_committee: Optional[float] = None
+    debts_owed_by_committee: Optional[float] = None
+
+    # Aggregate totals (cycle / FEC aggregation)
+    receipts: Optional[float] = None
+    fed_receipts: Optional[float] = None
+    total_exp_subject_limits: Optional[float] = None
+    exp_subject_limits: Optional[float] = None
+    exp_prior_years_subject_limits: Optional[float] = None
+    disbursements: Optional[float] = None
+    fed_disbursements: Optional[float] = None
+    net_contributions: Optional[float] = None
+    net_operating_expenditures: Optional[float] = None
+
+    # Contributions (receipts side)
+    contributions: Optional[float] = None
+    individual_contributions: Optional[float] = None
+    individual_itemized_contributions: Optional[float] = None
+    individual_unitemized_contributions: Optional[float] = None
+    political_party_committee_contributions: Optional[float] = None
+    other_political_committee_contributions: Optional[float] = None
+    contribution_refunds: Optional[float] = None
+    refunded_individual_contributions: Optional[float] = None
+    refunded_other_political_committee_contributions: Optional[float] = None
+    refunded_political_party_committee_contributions: Optional[float] = None
+
+    # Receipts — other categories
+    federal_funds: Optional[float] = None
+    other_fed_receipts: Optional[float] = None
+    other_receipts: Optional[float] = None  # sometimes present on other committee types
+    offsets_to_operating_expenditures: Optional[float] = None
+
+    # Transfers (incoming/outgoing)
+    total_transfers: Optional[float] = None
+    transfers_from_affiliated_party: Optional[float] = None
+    transfers_from_nonfed_account: Optional[float] = None
+    transfers_from_nonfed_levin: Optional[float] = None
+    transfers_to_affiliated_committee: Optional[float] = None
+
+    # Loans (received/made/repayments)
+    all_loans_received: Optional[float] = None
+    loan_repayments_made: Optional[float] = None
+    loan_repayments_received: Optional[float] = None
+    loans_made: Optional[float] = None
+    loans_and_loan_repayments_made: Optional[float] = None
+    loans_and_loan_repayments_received: Optional[float] = None
+
+    # Disbursements (operating/other)
+    operating_expenditures: Optional[float] = None
+    fed_operating_expenditures: Optional[float] = None
+    other_disbursements: Optional[float] = None
+    other_fed_operating_expenditures: Optional[float] = None
+    fundraising_disbursements: Optional[float] = None
+
+    # Independent/coordinated/party activity
+    independent_expenditures: Optional[float] = None
+    coordinated_expenditures_by_party_committee: Optional[float] = None
+    fed_election_activity: Optional[float] = None
+    non_allocated_fed_election_activity: Optional[float] = None
+    shared_fed_activity: Optional[float] = None
+    shared_fed_activity_nonfed: Optional[float] = None
+    shared_fed_operating_expenditures: Optional[float] = None
+    shared_nonfed_operating_expenditures: Optional[float] = None
+    fed_candidate_committee_contributions: Optional[float] = None
+    fed_candidate_contribution_refunds: Optional[float] = None
+
+    # Convention (rare; keep for compatibility)
+    convention_exp: Optional[float] = None
+    itemized_convention_exp: Optional[float] = None
+    unitemized_convention_exp: Optional[float] = None
+    refunds_relating_convention_exp: Optional[float] = None
+    itemized_refunds_relating_convention_exp: Optional[float] = None
+    unitemized_refunds_relating_convention_exp: Optional[float] = None
+
+    # Other income / refunds (granular)
+    itemized_other_income: Optional[float] = None
+    unitemized_other_income: Optional[float] = None
+    other_refunds: Optional[float] = None
+    itemized_other_refunds: Optional[float] = None
+    unitemized_other_refunds: Optional[float] = None
+
+    # Other disbursements (granular)
+    itemized_other_disb: Optional[float] = None
+    unitemized_other_disb: Optional[float] = None
+
+    # Derived/percent fields (if present)
+    individual_contributions_percent: Optional[float] = None
+    party_and_other_committee_contributions_percent: Optional[float] = None
+    contributions_ie_and_party_expenditures_made_percent: Optional[float] = None
+    operating_expenditures_percent: Optional[float] = None
+
+    # Sponsors (rare)
+    sponsor_candidate_ids: Optional[str] = None
+    sponsor_candidate_list: Optional[List[str]] = None
+
+
+
+
+
+# -- Replace your CommitteeAbout with this --
+class CommitteeAbout(FECModel):
+    # Core identity
+    committee_id: str
+    name: Optional[str] = None
+
+    # Leadership
+    treasurer_name: Optional[str] = None
+
+    # Type / designation (short + full)
+    committee_type: Optional[str] = None
+    committee_type_full: Optional[str] = None
+    designation: Optional[str] = None
+    designation_full: Optional[str] = None
+
+    # Filing (fixes your error)
+    filing_frequency: Optional[str] = None
+
+    # Party
+    party: Optional[str] = None
+    party_full: Optional[str] = None
+
+    # Location
+    state: Optional[str] = None
+    state_full: Optional[str] = None
+    city: Optional[str] = None
+    zip: Optional[str] = None
+    street_1: Optional[str] = None
+    street_2: Optional[str] = None
+
+    # Misc
+    website: Optional[str] = None
+
+
+
+
+class CandidateHit(FECModel):
+    candidate_id: str
+    name: str
+    office: Optional[str] = None
+    party: Optional[str] = None
+    state: Optional[str] = None
+    district: Optional[str] = None
+    election_years: Optional[List[int]] = None
+
+
+class DonorToCandidateAgg(FECModel):
+    donor_committee_id: str
+    donor_committee_name: Optional[str] = None
+    total: float
+    count: int
+
+
+class CommitteeSummary(FECModel):
+    about: Optional[CommitteeAbout] = None
+    totals: Optional[CommitteeTotals] = None
+    latest_report: Optional[CommitteeReport] = None
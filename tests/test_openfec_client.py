@@ -0,0 +1,340 @@
+"""Stub-session tests for OpenFECClient pagination (no network access)."""
+
+import asyncio
+import json
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp"))
+
+import openfec_client  # noqa: E402
+from openfec_client import OpenFECClient  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200, headers=None):
+        self.content = json.dumps(payload).encode()
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error", response=self)
+
+
+class FakeSession:
+    """
+    Serves `pages` pages of `per_page` rows and records every requested page number.
+    `rows(page, params)`, if given, supplies each page's rows instead.
+    """
+
+    def __init__(self, pages, per_page=100, with_pagination=True, rows=None):
+        self.pages = pages
+        self.per_page = per_page
+        self.with_pagination = with_pagination
+        self.rows = rows
+        self.requested = []
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None):
+        page = int(params.get("page", 1))
+        with self._lock:
+            self.requested.append(page)
+            self.calls.append(dict(params))
+        rows = []
+        if page <= self.pages and self.rows is not None:
+            rows = self.rows(page, params)
+        elif page <= self.pages:
+            rows = [
+                {
+                    "sub_id": page * 1000 + i,
+                    "committee_id": f"C{page:03d}{i:03d}",
+                    "total": 1.0,
+                    "count": 1,
+                }
+                for i in range(self.per_page)
+            ]
+        payload = {"results": rows}
+        if self.with_pagination:
+            payload["pagination"] = {
+                "page": page,
+                "pages": self.pages,
+                "per_page": self.per_page,
+                "count": self.pages * self.per_page,
+            }
+        return FakeResponse(payload)
+
+
+def make_client(session, **kwargs):
+    client = OpenFECClient(api_key="test", retry_attempts=1, **kwargs)
+    client.session.get = session.get
+    return client
+
+
+@pytest.mark.parametrize("with_pagination", [True, False])
+def test_paginate_yields_rows_in_page_order(with_pagination):
+    session = FakeSession(pages=12, per_page=5, with_pagination=with_pagination)
+    client = make_client(session, max_workers=4)
+
+    rows = list(client._paginate("schedules/schedule_b/", {"per_page": 5}))
+
+    assert [r["committee_id"] for r in rows] == [
+        f"C{p:03d}{i:03d}" for p in range(1, 13) for i in range(5)
+    ]
+
+
+@pytest.mark.parametrize("with_pagination", [True, False])
+def test_paginate_respects_max_pages(with_pagination):
+    session = FakeSession(pages=12, per_page=5, with_pagination=with_pagination)
+    client = make_client(session, max_workers=4)
+
+    rows = list(client._paginate("schedules/schedule_b/", {"per_page": 5}, max_pages=3))
+
+    assert len(rows) == 15
+    assert sorted(session.requested) == [1, 2, 3]
+
+
+def test_paginate_early_stop_stays_within_window():
+    session = FakeSession(pages=30, per_page=5)
+    client = make_client(session, max_workers=8)
+
+    pages = client._paginate("schedules/schedule_b/", {"per_page": 5}, window=2)
+    next(pages)
+    pages.close()
+
+    # first page plus at most one window of prefetched pages
+    assert len(session.requested) <= 3
+
+
+def test_paginate_ramp_prefetches_nothing_during_first_page():
+    session = FakeSession(pages=30, per_page=5)
+    client = make_client(session, max_workers=8)
+
+    pages = client._paginate("schedules/schedule_b/", {"per_page": 5}, ramp=True)
+    for _ in range(5):  # the first page's rows only
+        next(pages)
+    pages.close()
+
+    assert session.requested == [1]
+
+
+def test_donor_aggregates_stop_at_limit():
+    session = FakeSession(pages=30)
+    client = make_client(session, max_workers=8)
+    client.candidate_committees = lambda *a, **k: [
+        type("Committee", (), {"committee_id": rcid})() for rcid in ("R1", "R2", "R3")
+    ]
+
+    aggs = client.donors_to_candidate_aggregates("P00000001", cycle=2024, limit=5)
+
+    # each recipient's first page already holds `limit` rows: one request per recipient
+    assert len(aggs) == 5
+    assert session.requested == [1, 1, 1]
+
+
+@pytest.mark.parametrize("limit, pages", [(5, [1]), (200, [1, 2])])
+def test_schedule_b_items_stop_at_limit(limit, pages):
+    session = FakeSession(pages=40)
+    client = make_client(session, max_workers=8)
+
+    items = list(client.committee_payments_to_candidate_items("C1", cycle=2024, limit=limit))
+
+    assert len(items) == limit
+    assert session.requested == pages
+
+
+def with_recipient_committees(client, count):
+    committees = [
+        type("Committee", (), {"committee_id": f"C{n:08d}"})() for n in range(count)
+    ]
+    client.candidate_committees = lambda *a, **k: committees
+    return client
+
+
+def test_schedule_b_batches_are_read_lazily_under_a_limit():
+    session = FakeSession(pages=40)
+    # 120 recipient committees: three recipient_committee_id batches of 50
+    client = with_recipient_committees(make_client(session, max_workers=8), 120)
+
+    items = list(client.committee_payments_to_candidate_items("C1", "P1", cycle=2024, limit=5))
+
+    assert len(items) == 5
+    assert session.requested == [1]
+
+
+def test_schedule_b_batches_are_all_read_in_order_without_a_limit():
+    session = FakeSession(pages=2)
+    client = with_recipient_committees(make_client(session, max_workers=8), 120)
+
+    items = list(
+        client.committee_payments_to_candidate_items(
+            "C1", "P1", cycle=2024, limit=None, scan_limit=None, max_pages=None, dedupe=False
+        )
+    )
+
+    assert len(items) == 3 * 2 * 100
+    assert len(session.requested) == 6
+    # each batch is first requested in input order (committee ids ascend across batches)
+    batches = [tuple(c["recipient_committee_id"]) for c in session.calls]
+    assert sorted(set(batches), key=batches.index) == sorted(set(batches))
+
+
+@pytest.fixture()
+def sleeps(monkeypatch):
+    """Record retry/throttle sleeps instead of sleeping."""
+    recorded = []
+    monkeypatch.setattr(openfec_client.time, "sleep", recorded.append)
+    return recorded
+
+
+def test_retry_after_delta_seconds_sets_shared_pause():
+    client = OpenFECClient(api_key="test")
+
+    assert client._throttle_delay("3", attempt=1) == 3.0
+    assert 2.5 < client._throttle_wait() <= 3.0
+
+
+def test_retry_after_http_date():
+    client = OpenFECClient(api_key="test")
+    when = datetime.now(timezone.utc) + timedelta(seconds=5)
+
+    assert 3.0 < client._throttle_delay(format_datetime(when, usegmt=True), attempt=1) <= 5.0
+
+
+def test_retry_after_unparseable_falls_back_to_backoff():
+    client = OpenFECClient(api_key="test", retry_backoff=0.5)
+
+    # attempt 3: 0.5 * 2**2 plus up to retry_backoff of jitter
+    assert 2.0 <= client._throttle_delay("soon", attempt=3) <= 2.5
+
+
+def test_throttle_pause_applies_to_other_requests(sleeps):
+    session = FakeSession(pages=1)
+    client = make_client(session)
+    client._throttle_delay("2", attempt=1)  # another worker was told to back off
+
+    client._fetch(client._url_prefix + "efile/filings/", {"page": 1})
+
+    assert len(sleeps) == 1 and 1.5 < sleeps[0] <= 2.0
+    assert session.requested == [1]
+
+
+def test_429_on_final_attempt_raises_http_error(sleeps):
+    client = OpenFECClient(api_key="test", retry_attempts=3)
+    calls = []
+
+    def throttled(url, params=None, timeout=None):
+        calls.append(params)
+        return FakeResponse({}, status_code=429, headers={"Retry-After": "1"})
+
+    client.session.get = throttled
+
+    with pytest.raises(requests.HTTPError):
+        client._fetch(client._url_prefix + "efile/filings/", {"page": 1})
+    assert len(calls) == 3
+
+
+def test_max_in_flight_bounds_async_requests():
+    httpx = pytest.importorskip("httpx")
+    client = OpenFECClient(api_key="test", max_in_flight=2)
+    active = peak = 0
+
+    async def handler(request):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(200, json={"results": [{"committee_id": "C1"}]})
+
+    async def run():
+        client._async_client()  # per-loop client and semaphore
+        client._ahttp = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            await asyncio.gather(
+                *(client._afetch(client._url_prefix + "efile/filings/", {"page": n}) for n in range(10))
+            )
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
+    assert peak == 2
+
+
+def schedule_b_items(rows, **kwargs):
+    session = FakeSession(pages=1, rows=lambda page, params: rows)
+    client = make_client(session)
+    kwargs.setdefault("cycle", 2024)
+    return list(client.committee_payments_to_candidate_items("C1", **kwargs)), session
+
+
+def test_schedule_b_dedupes_across_streams():
+    # every recipient_committee_id batch returns the same transactions
+    session = FakeSession(pages=1, rows=lambda page, params: [{"sub_id": n} for n in range(10)])
+    client = with_recipient_committees(make_client(session), 120)
+
+    items = list(client.committee_payments_to_candidate_items("C1", "P1", cycle=2024, limit=None))
+
+    assert len(session.requested) == 3
+    assert [i.sub_id for i in items] == list(range(10))
+
+
+def test_schedule_b_dedupes_rows_without_sub_id():
+    rows = [
+        {"file_number": 1, "transaction_id": "T1", "disbursement_amount": 10.0},
+        {"file_number": 1, "transaction_id": "T1", "disbursement_amount": 12.0},  # same filing + txn
+        {"file_number": 2, "transaction_id": "T1", "disbursement_amount": 10.0},  # amended filing
+        {"image_number": "I1", "disbursement_amount": 5.001, "disbursement_date": "2024-03-01"},
+        {"image_number": "I1", "disbursement_amount": 5.0, "disbursement_date": "2024-03-01"},  # same cents
+        {"image_number": "I1", "disbursement_amount": 6.0, "disbursement_date": "2024-03-01"},
+    ]
+
+    items, _ = schedule_b_items(rows)
+
+    assert [(i.file_number, i.disbursement_amount) for i in items] == [
+        (1, 10.0),
+        (2, 10.0),
+        (None, 5.001),
+        (None, 6.0),
+    ]
+
+
+def test_schedule_b_since_until_with_time_part():
+    rows = [
+        {"sub_id": 1, "disbursement_date": "2023-12-31T00:00:00"},
+        {"sub_id": 2, "disbursement_date": "2024-01-01T00:00:00"},
+        {"sub_id": 3, "disbursement_date": "2024-06-30T18:00:00"},
+        {"sub_id": 4, "disbursement_date": "2024-07-01T00:00:00"},
+    ]
+
+    items, session = schedule_b_items(rows, since="2024-01-01T00:00:00", until="2024-06-30 23:59")
+
+    assert [i.sub_id for i in items] == [2, 3]
+    assert session.calls[0]["min_date"] == "2024-01-01"
+    assert session.calls[0]["max_date"] == "2024-06-30"
+
+
+def test_schedule_b_rejects_non_iso_dates():
+    with pytest.raises(ValueError):
+        schedule_b_items([], until="12/31/2024")
+
+
+@pytest.mark.parametrize("include_memos, expected", [(False, [1, 3]), (True, [1, 2, 3])])
+def test_schedule_b_memo_filter(include_memos, expected):
+    rows = [
+        {"sub_id": 1, "memoed_subtotal": False},
+        {"sub_id": 2, "memoed_subtotal": True},
+        {"sub_id": 3},
+    ]
+
+    items, session = schedule_b_items(rows, include_memos=include_memos)
+
+    assert [i.sub_id for i in items] == expected
+    assert ("memoed_subtotal" in session.calls[0]) is not include_memos